@@ -10,26 +10,156 @@ import time
 import json
 import random
 import hashlib
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Mapping, Tuple
 from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 
+# Set LLK_FAST_BOOT=1 to skip the simulated hardware delays in driver load()
+FAST_BOOT = os.environ.get('LLK_FAST_BOOT') == '1'
+
+# Set LLK_QUIET=1 to silence informational messages from per-device
+# operations (mount, interface up, packet send, hotplug, eject, render)
+QUIET = os.environ.get('LLK_QUIET') == '1'
+
+
+# ===== STATIC DEVICE TABLES =====
+
+# Simulated hardware seen by each driver's probe(); copied per probe so
+# runtime state (mounted, ip, stats) never leaks back into the tables
+
+def _freeze(*devices: Dict) -> tuple:
+    """Intern device IDs and wrap templates in read-only mapping views"""
+    for dev in devices:
+        # Interned IDs let dict lookups short-circuit on identity
+        dev['id'] = sys.intern(dev['id'])
+    return tuple(MappingProxyType(dev) for dev in devices)
+
+
+_BLOCK_DEVS = _freeze(
+    {
+        'id': 'sda',
+        'type': 'disk',
+        'size': 500 * 1024 * 1024 * 1024,  # 500GB
+        'model': 'Virtual SATA Drive',
+        'mounted': False,
+        'partitions': ('sda1', 'sda2')
+    },
+    {
+        'id': 'sdb',
+        'type': 'disk',
+        'size': 1 * 1024 * 1024 * 1024 * 1024,  # 1TB
+        'model': 'Virtual NVMe Drive',
+        'mounted': False,
+        'partitions': ('sdb1',)
+    },
+    {
+        'id': 'loop0',
+        'type': 'loop',
+        'size': 10 * 1024 * 1024,  # 10MB
+        'model': 'Loop Device',
+        'mounted': False,
+        'partitions': ()
+    },
+)
+
+_NETWORK_IFACES = _freeze(
+    {
+        'id': 'eth0',
+        'type': 'ethernet',
+        'mac': None,  # generated per probe
+        'state': 'down',
+        'ip': None,
+        'speed': '1000Mbps',
+        'driver': 'virtio_net'
+    },
+    {
+        'id': 'wlan0',
+        'type': 'wireless',
+        'mac': None,  # generated per probe
+        'state': 'down',
+        'ip': None,
+        'speed': '300Mbps',
+        'driver': 'ath9k'
+    },
+    {
+        'id': 'lo',
+        'type': 'loopback',
+        'mac': '00:00:00:00:00:00',
+        'state': 'up',
+        'ip': '127.0.0.1',
+        'speed': 'N/A',
+        'driver': 'loopback'
+    },
+)
+
+_USB_DEVS = _freeze(
+    {
+        'id': 'usb-1-1',
+        'port': '1-1',
+        'vendor_id': '0x046d',
+        'product_id': '0xc52b',
+        'vendor': 'Logitech',
+        'product': 'USB Mouse',
+        'type': 'HID',
+        'speed': 'Full Speed (12 Mbps)'
+    },
+    {
+        'id': 'usb-1-2',
+        'port': '1-2',
+        'vendor_id': '0x0951',
+        'product_id': '0x1666',
+        'vendor': 'Kingston',
+        'product': 'DataTraveler 3.0',
+        'type': 'Mass Storage',
+        'speed': 'High Speed (480 Mbps)'
+    },
+    {
+        'id': 'usb-2-1',
+        'port': '2-1',
+        'vendor_id': '0x8087',
+        'product_id': '0x0026',
+        'vendor': 'Intel',
+        'product': 'Bluetooth Controller',
+        'type': 'Wireless',
+        'speed': 'Full Speed (12 Mbps)'
+    },
+)
+
+_GPU_DEVS = _freeze(
+    {
+        'id': 'gpu0',
+        'vendor': 'NVIDIA',
+        'model': 'GeForce RTX 4090',
+        'vram': 24 * 1024,  # 24GB in MB
+        'pcie_gen': 'Gen 4',
+        'driver_version': '535.129.03',
+        'temperature': 45,
+        'power_usage': 120,
+        'utilization': 0
+    },
+)
+
 
 # ===== BASE DRIVER CLASS =====
 
 class BaseDriver(ABC):
     """Base class for all drivers"""
     
+    __slots__ = ('name', 'version', 'loaded', 'status', 'devices', '_info_cache')
+    
     def __init__(self, name: str, version: str = "1.0.0"):
         self.name = name
         self.version = version
         self.loaded = False
         self.status = "unloaded"
         self.devices = {}
+        self._info_cache: Optional[Mapping] = None
         
     @abstractmethod
-    def load(self) -> bool:
-        """Load the driver"""
+    def load(self, log=print) -> bool:
+        """Load the driver; status lines go through log (print by default)"""
         pass
     
     @abstractmethod
@@ -42,15 +172,17 @@ class BaseDriver(ABC):
         """Probe for devices"""
         pass
     
-    def get_info(self) -> Dict:
-        """Get driver information"""
-        return {
-            'name': self.name,
-            'version': self.version,
-            'status': self.status,
-            'loaded': self.loaded,
-            'devices': len(self.devices)
-        }
+    def get_info(self) -> Mapping:
+        """Get driver information (cached; a read-only view shared by all callers)"""
+        if self._info_cache is None:
+            self._info_cache = MappingProxyType({
+                'name': self.name,
+                'version': self.version,
+                'status': self.status,
+                'loaded': self.loaded,
+                'devices': len(self.devices)
+            })
+        return self._info_cache
 
 
 # ===== BLOCK DEVICE DRIVER =====
@@ -58,22 +190,32 @@ class BaseDriver(ABC):
 class BlockDriver(BaseDriver):
     """Block device driver (disks, partitions)"""
     
+    __slots__ = ('block_size',)
+    
+    DRIVER_NAME = "block_driver"
+    DRIVER_VERSION = "1.0.0"
+    
+    # bytes are immutable, so every simulated read can share one buffer
+    _ZERO_BLOCK = bytes(4096)
+    
     def __init__(self):
-        super().__init__("block_driver", "1.0.0")
+        super().__init__(self.DRIVER_NAME, self.DRIVER_VERSION)
         self.block_size = 4096  # 4KB blocks
         
-    def load(self) -> bool:
+    def load(self, log=print) -> bool:
         """Load block driver"""
-        print(f"📀 Loading {self.name}...")
-        time.sleep(0.2)
+        log(f"📀 Loading {self.name}...")
+        if not FAST_BOOT:
+            time.sleep(0.2)
         
         self.loaded = True
         self.status = "loaded"
+        self._info_cache = None
         
         # Auto-probe for devices
         self.probe()
         
-        print(f"✅ {self.name} loaded ({len(self.devices)} devices)")
+        log(f"✅ {self.name} loaded ({len(self.devices)} devices)")
         return True
     
     def unload(self) -> bool:
@@ -83,13 +225,12 @@ class BlockDriver(BaseDriver):
         
         print(f"🔌 Unloading {self.name}...")
         
-        # Unmount all devices
-        for dev_id in list(self.devices.keys()):
-            self.unmount_device(dev_id)
-        
+        # Device records are dropped wholesale, so there is no need to
+        # unmount them one by one first
         self.loaded = False
         self.status = "unloaded"
         self.devices = {}
+        self._info_cache = None
         
         print(f"✅ {self.name} unloaded")
         return True
@@ -97,46 +238,17 @@ class BlockDriver(BaseDriver):
     def probe(self) -> List[Dict]:
         """Probe for block devices"""
         # Simulate detecting block devices
-        block_devices = [
-            {
-                'id': 'sda',
-                'type': 'disk',
-                'size': 500 * 1024 * 1024 * 1024,  # 500GB
-                'model': 'Virtual SATA Drive',
-                'mounted': False,
-                'partitions': ['sda1', 'sda2']
-            },
-            {
-                'id': 'sdb',
-                'type': 'disk',
-                'size': 1 * 1024 * 1024 * 1024 * 1024,  # 1TB
-                'model': 'Virtual NVMe Drive',
-                'mounted': False,
-                'partitions': ['sdb1']
-            },
-            {
-                'id': 'loop0',
-                'type': 'loop',
-                'size': 10 * 1024 * 1024,  # 10MB
-                'model': 'Loop Device',
-                'mounted': False,
-                'partitions': []
-            }
-        ]
-        
-        for dev in block_devices:
-            self.devices[dev['id']] = dev
-        
-        return block_devices
+        self.devices.update({d['id']: d.copy() for d in _BLOCK_DEVS})
+        self._info_cache = None
+        return list(self.devices.values())
     
     def mount_device(self, device_id: str, mountpoint: str) -> bool:
         """Mount block device"""
-        if device_id not in self.devices:
+        device = self.devices.get(device_id)
+        if device is None:
             print(f"❌ Device not found: {device_id}")
             return False
         
-        device = self.devices[device_id]
-        
         if device.get('mounted'):
             print(f"⚠️  Device already mounted: {device_id}")
             return False
@@ -144,15 +256,16 @@ class BlockDriver(BaseDriver):
         device['mounted'] = True
         device['mountpoint'] = mountpoint
         
-        print(f"✅ Mounted {device_id} at {mountpoint}")
+        if not QUIET:
+            print(f"✅ Mounted {device_id} at {mountpoint}")
         return True
     
     def unmount_device(self, device_id: str) -> bool:
         """Unmount block device"""
-        if device_id not in self.devices:
+        device = self.devices.get(device_id)
+        if device is None:
             return False
         
-        device = self.devices[device_id]
         device['mounted'] = False
         device.pop('mountpoint', None)
         
@@ -164,7 +277,9 @@ class BlockDriver(BaseDriver):
             return None
         
         # Simulate block read
-        return b'\x00' * self.block_size
+        if self.block_size == len(self._ZERO_BLOCK):
+            return self._ZERO_BLOCK
+        return bytes(self.block_size)
     
     def write_block(self, device_id: str, block_num: int, data: bytes) -> bool:
         """Write a block to device"""
@@ -183,21 +298,28 @@ class BlockDriver(BaseDriver):
 class NetworkDriver(BaseDriver):
     """Network interface driver"""
     
+    __slots__ = ()
+    
+    DRIVER_NAME = "network_driver"
+    DRIVER_VERSION = "1.0.0"
+    
     def __init__(self):
-        super().__init__("network_driver", "1.0.0")
+        super().__init__(self.DRIVER_NAME, self.DRIVER_VERSION)
         
-    def load(self) -> bool:
+    def load(self, log=print) -> bool:
         """Load network driver"""
-        print(f"🌐 Loading {self.name}...")
-        time.sleep(0.2)
+        log(f"🌐 Loading {self.name}...")
+        if not FAST_BOOT:
+            time.sleep(0.2)
         
         self.loaded = True
         self.status = "loaded"
+        self._info_cache = None
         
         # Auto-probe for interfaces
         self.probe()
         
-        print(f"✅ {self.name} loaded ({len(self.devices)} interfaces)")
+        log(f"✅ {self.name} loaded ({len(self.devices)} interfaces)")
         return True
     
     def unload(self) -> bool:
@@ -207,83 +329,56 @@ class NetworkDriver(BaseDriver):
         
         print(f"🔌 Unloading {self.name}...")
         
-        # Bring down all interfaces
-        for iface_id in list(self.devices.keys()):
-            self.interface_down(iface_id)
-        
+        # Interface records are dropped wholesale, so there is no need to
+        # bring them down one by one first
         self.loaded = False
         self.status = "unloaded"
         self.devices = {}
+        self._info_cache = None
         
         print(f"✅ {self.name} unloaded")
         return True
     
     def probe(self) -> List[Dict]:
         """Probe for network interfaces"""
-        interfaces = [
-            {
-                'id': 'eth0',
-                'type': 'ethernet',
-                'mac': self._generate_mac(),
-                'state': 'down',
-                'ip': None,
-                'speed': '1000Mbps',
-                'driver': 'virtio_net'
-            },
-            {
-                'id': 'wlan0',
-                'type': 'wireless',
-                'mac': self._generate_mac(),
-                'state': 'down',
-                'ip': None,
-                'speed': '300Mbps',
-                'driver': 'ath9k'
-            },
-            {
-                'id': 'lo',
-                'type': 'loopback',
-                'mac': '00:00:00:00:00:00',
-                'state': 'up',
-                'ip': '127.0.0.1',
-                'speed': 'N/A',
-                'driver': 'loopback'
-            }
-        ]
-        
-        for iface in interfaces:
-            self.devices[iface['id']] = iface
-        
-        return interfaces
-    
-    def _generate_mac(self) -> str:
-        """Generate random MAC address"""
-        mac = [random.randint(0x00, 0xff) for _ in range(6)]
-        return ':'.join(f'{x:02x}' for x in mac)
+        macs = self._generate_macs(len(_NETWORK_IFACES))
+        self.devices.update({
+            d['id']: dict(d, mac=d['mac'] or mac)
+            for d, mac in zip(_NETWORK_IFACES, macs)
+        })
+        self._info_cache = None
+        return list(self.devices.values())
+    
+    def _generate_macs(self, count: int) -> List[str]:
+        """Generate random MAC addresses from a single RNG draw"""
+        raw = random.randbytes(6 * count)
+        return [raw[i:i + 6].hex(':') for i in range(0, len(raw), 6)]
     
     def interface_up(self, interface_id: str, ip: str = None) -> bool:
         """Bring interface up"""
-        if interface_id not in self.devices:
+        iface = self.devices.get(interface_id)
+        if iface is None:
             print(f"❌ Interface not found: {interface_id}")
             return False
         
-        iface = self.devices[interface_id]
         iface['state'] = 'up'
         
         if ip:
             iface['ip'] = ip
         
-        print(f"✅ Interface {interface_id} is up")
-        if ip:
-            print(f"   IP: {ip}")
+        if not QUIET:
+            print(f"✅ Interface {interface_id} is up")
+            if ip:
+                print(f"   IP: {ip}")
         
         return True
     
     def interface_down(self, interface_id: str) -> bool:
         """Bring interface down"""
-        if interface_id not in self.devices:
+        iface = self.devices.get(interface_id)
+        if iface is None:
             return False
         
-        iface = self.devices[interface_id]
         iface['state'] = 'down'
         iface['ip'] = None
         
@@ -291,26 +386,25 @@ class NetworkDriver(BaseDriver):
     
     def send_packet(self, interface_id: str, dest_ip: str, data: bytes) -> bool:
         """Send packet through interface"""
-        if interface_id not in self.devices:
+        iface = self.devices.get(interface_id)
+        if iface is None:
             return False
         
-        iface = self.devices[interface_id]
-        
         if iface['state'] != 'up':
             print(f"❌ Interface {interface_id} is down")
             return False
         
         # Simulate packet send
-        print(f"📤 Sent {len(data)} bytes to {dest_ip} via {interface_id}")
+        if not QUIET:
+            print(f"📤 Sent {len(data)} bytes to {dest_ip} via {interface_id}")
         return True
     
     def receive_packet(self, interface_id: str) -> Optional[Dict]:
         """Receive packet from interface (simulated)"""
-        if interface_id not in self.devices:
+        iface = self.devices.get(interface_id)
+        if iface is None:
             return None
         
-        iface = self.devices[interface_id]
-        
         if iface['state'] != 'up':
             return None
         
@@ -318,7 +412,7 @@ class NetworkDriver(BaseDriver):
         packet = {
             'source': '192.168.1.100',
             'dest': iface.get('ip', '0.0.0.0'),
-            'size': random.randint(64, 1500),
+            'size': 64 + int(random.random() * 1437),  # 64-1500
             'protocol': 'TCP',
             'data': b'simulated packet data'
         }
@@ -331,21 +425,28 @@ class NetworkDriver(BaseDriver):
 class USBDriver(BaseDriver):
     """USB device driver"""
     
+    __slots__ = ()
+    
+    DRIVER_NAME = "usb_driver"
+    DRIVER_VERSION = "1.0.0"
+    
     def __init__(self):
-        super().__init__("usb_driver", "1.0.0")
+        super().__init__(self.DRIVER_NAME, self.DRIVER_VERSION)
         
-    def load(self) -> bool:
+    def load(self, log=print) -> bool:
         """Load USB driver"""
-        print(f"🔌 Loading {self.name}...")
-        time.sleep(0.2)
+        log(f"🔌 Loading {self.name}...")
+        if not FAST_BOOT:
+            time.sleep(0.2)
         
         self.loaded = True
         self.status = "loaded"
+        self._info_cache = None
         
         # Auto-probe for devices
         self.probe()
         
-        print(f"✅ {self.name} loaded ({len(self.devices)} devices)")
+        log(f"✅ {self.name} loaded ({len(self.devices)} devices)")
         return True
     
     def unload(self) -> bool:
@@ -358,57 +459,26 @@ class USBDriver(BaseDriver):
         self.loaded = False
         self.status = "unloaded"
         self.devices = {}
+        self._info_cache = None
         
         print(f"✅ {self.name} unloaded")
         return True
     
     def probe(self) -> List[Dict]:
         """Probe for USB devices"""
-        usb_devices = [
-            {
-                'id': 'usb-1-1',
-                'port': '1-1',
-                'vendor_id': '0x046d',
-                'product_id': '0xc52b',
-                'vendor': 'Logitech',
-                'product': 'USB Mouse',
-                'type': 'HID',
-                'speed': 'Full Speed (12 Mbps)'
-            },
-            {
-                'id': 'usb-1-2',
-                'port': '1-2',
-                'vendor_id': '0x0951',
-                'product_id': '0x1666',
-                'vendor': 'Kingston',
-                'product': 'DataTraveler 3.0',
-                'type': 'Mass Storage',
-                'speed': 'High Speed (480 Mbps)'
-            },
-            {
-                'id': 'usb-2-1',
-                'port': '2-1',
-                'vendor_id': '0x8087',
-                'product_id': '0x0026',
-                'vendor': 'Intel',
-                'product': 'Bluetooth Controller',
-                'type': 'Wireless',
-                'speed': 'Full Speed (12 Mbps)'
-            }
-        ]
-        
-        for dev in usb_devices:
-            self.devices[dev['id']] = dev
-        
-        return usb_devices
+        self.devices.update({d['id']: d.copy() for d in _USB_DEVS})
+        self._info_cache = None
+        return list(self.devices.values())
     
     def hotplug(self, vendor_id: str, product_id: str, product_name: str) -> str:
         """Simulate USB hotplug event"""
-        device_id = f"usb-{random.randint(1,9)}-{random.randint(1,9)}"
+        bus, dev = divmod(random.randrange(81), 9)
+        port = f"{bus + 1}-{dev + 1}"
+        device_id = sys.intern(f"usb-{port}")
         
         device = {
             'id': device_id,
-            'port': device_id.replace('usb-', ''),
+            'port': port,
             'vendor_id': vendor_id,
             'product_id': product_id,
             'vendor': 'Unknown',
@@ -418,24 +488,29 @@ class USBDriver(BaseDriver):
         }
         
         self.devices[device_id] = device
+        self._info_cache = None
         
-        print(f"🔌 USB device connected: {device_id}")
-        print(f"   {product_name}")
+        if not QUIET:
+            print(f"🔌 USB device connected: {device_id}")
+            print(f"   {product_name}")
         
         return device_id
     
     def eject(self, device_id: str) -> bool:
         """Eject USB device"""
-        if device_id not in self.devices:
+        device = self.devices.get(device_id)
+        if device is None:
             print(f"❌ Device not found: {device_id}")
             return False
         
-        device = self.devices[device_id]
-        print(f"⏏️  Ejecting {device['product']}...")
+        if not QUIET:
+            print(f"⏏️  Ejecting {device['product']}...")
         
         del self.devices[device_id]
+        self._info_cache = None
         
-        print(f"✅ Device {device_id} safely removed")
+        if not QUIET:
+            print(f"✅ Device {device_id} safely removed")
         return True
 
 
@@ -444,21 +519,28 @@ class USBDriver(BaseDriver):
 class GPUDriver(BaseDriver):
     """Graphics processing unit driver"""
     
+    __slots__ = ()
+    
+    DRIVER_NAME = "gpu_driver"
+    DRIVER_VERSION = "1.0.0"
+    
     def __init__(self):
-        super().__init__("gpu_driver", "1.0.0")
+        super().__init__(self.DRIVER_NAME, self.DRIVER_VERSION)
         
-    def load(self) -> bool:
+    def load(self, log=print) -> bool:
         """Load GPU driver"""
-        print(f"🎮 Loading {self.name}...")
-        time.sleep(0.3)
+        log(f"🎮 Loading {self.name}...")
+        if not FAST_BOOT:
+            time.sleep(0.3)
         
         self.loaded = True
         self.status = "loaded"
+        self._info_cache = None
         
         # Auto-probe for GPUs
         self.probe()
         
-        print(f"✅ {self.name} loaded ({len(self.devices)} GPUs)")
+        log(f"✅ {self.name} loaded ({len(self.devices)} GPUs)")
         return True
     
     def unload(self) -> bool:
@@ -471,61 +553,50 @@ class GPUDriver(BaseDriver):
         self.loaded = False
         self.status = "unloaded"
         self.devices = {}
+        self._info_cache = None
         
         print(f"✅ {self.name} unloaded")
         return True
     
     def probe(self) -> List[Dict]:
         """Probe for GPUs"""
-        gpus = [
-            {
-                'id': 'gpu0',
-                'vendor': 'NVIDIA',
-                'model': 'GeForce RTX 4090',
-                'vram': 24 * 1024,  # 24GB in MB
-                'pcie_gen': 'Gen 4',
-                'driver_version': '535.129.03',
-                'temperature': 45,
-                'power_usage': 120,
-                'utilization': 0
-            }
-        ]
-        
-        for gpu in gpus:
-            self.devices[gpu['id']] = gpu
-        
-        return gpus
+        self.devices.update({d['id']: d.copy() for d in _GPU_DEVS})
+        self._info_cache = None
+        return list(self.devices.values())
     
     def get_stats(self, gpu_id: str) -> Optional[Dict]:
         """Get GPU statistics"""
-        if gpu_id not in self.devices:
+        gpu = self.devices.get(gpu_id)
+        if gpu is None:
             return None
         
-        gpu = self.devices[gpu_id]
-        
-        # Simulate changing stats
-        gpu['temperature'] = random.randint(40, 85)
-        gpu['power_usage'] = random.randint(80, 350)
-        gpu['utilization'] = random.randint(0, 100)
+        # Simulate changing stats: one 64-bit draw split into four 16-bit
+        # fields, each scaled into its range with a multiply + shift
+        bits = random.getrandbits(64)
+        gpu['temperature'] = 40 + ((bits & 0xFFFF) * 46 >> 16)             # 40-85
+        gpu['power_usage'] = 80 + (((bits >> 16) & 0xFFFF) * 271 >> 16)    # 80-350
+        gpu['utilization'] = ((bits >> 32) & 0xFFFF) * 101 >> 16            # 0-100
+        vram_used = ((bits >> 48) & 0xFFFF) * (gpu['vram'] + 1) >> 16       # 0-vram
         
         return {
             'temperature': gpu['temperature'],
             'power_usage': gpu['power_usage'],
             'utilization': gpu['utilization'],
-            'vram_used': random.randint(0, gpu['vram']),
+            'vram_used': vram_used,
             'vram_total': gpu['vram']
         }
     
     def render_frame(self, gpu_id: str, width: int, height: int) -> bool:
         """Simulate rendering a frame"""
-        if gpu_id not in self.devices:
+        gpu = self.devices.get(gpu_id)
+        if gpu is None:
             return False
         
-        gpu = self.devices[gpu_id]
         pixels = width * height
         
-        print(f"🎨 Rendering {width}x{height} frame on {gpu['model']}")
-        print(f"   Total pixels: {pixels:,}")
+        if not QUIET:
+            print(f"🎨 Rendering {width}x{height} frame on {gpu['model']}")
+            print(f"   Total pixels: {pixels:,}")
         
         # Simulate render time
         time.sleep(0.1)
@@ -539,29 +610,52 @@ class DriverManager:
     """Manage all kernel drivers"""
     
     def __init__(self):
-        self.drivers = {}
+        self.drivers = {}  # instantiated drivers only
         self.loaded_drivers = []
+        self._driver_list: Optional[Tuple[Mapping, ...]] = None
+        self._driver_list_src: tuple = ()
         
         # Register available drivers
         self._register_drivers()
     
     def _register_drivers(self):
-        """Register all available drivers"""
-        self.drivers = {
-            'block': BlockDriver(),
-            'network': NetworkDriver(),
-            'usb': USBDriver(),
-            'gpu': GPUDriver()
+        """Register all available drivers (instantiated on first use)"""
+        self._driver_classes = {
+            'block': BlockDriver,
+            'network': NetworkDriver,
+            'usb': USBDriver,
+            'gpu': GPUDriver
+        }
+        
+        # Info reported for drivers that have not been instantiated yet
+        self._idle_info = {
+            name: {
+                'name': cls.DRIVER_NAME,
+                'version': cls.DRIVER_VERSION,
+                'status': 'unloaded',
+                'loaded': False,
+                'devices': 0
+            }
+            for name, cls in self._driver_classes.items()
         }
     
+    def _instantiate(self, driver_name: str) -> Optional[BaseDriver]:
+        """Return the driver instance, creating it on first access"""
+        driver = self.drivers.get(driver_name)
+        if driver is None:
+            driver_class = self._driver_classes.get(driver_name)
+            if driver_class is None:
+                return None
+            driver = self.drivers[driver_name] = driver_class()
+        return driver
+    
     def load_driver(self, driver_name: str) -> bool:
         """Load a driver"""
-        if driver_name not in self.drivers:
+        driver = self._instantiate(driver_name)
+        if driver is None:
             print(f"❌ Driver not found: {driver_name}")
             return False
         
-        driver = self.drivers[driver_name]
-        
         if driver.loaded:
             print(f"⚠️  Driver already loaded: {driver_name}")
             return True
@@ -575,13 +669,12 @@ class DriverManager:
     
     def unload_driver(self, driver_name: str) -> bool:
         """Unload a driver"""
-        if driver_name not in self.drivers:
+        if driver_name not in self._driver_classes:
             print(f"❌ Driver not found: {driver_name}")
             return False
         
-        driver = self.drivers[driver_name]
-        
-        if not driver.loaded:
+        driver = self.drivers.get(driver_name)
+        if driver is None or not driver.loaded:
             print(f"⚠️  Driver not loaded: {driver_name}")
             return True
         
@@ -596,8 +689,26 @@ class DriverManager:
         """Load all drivers"""
         print("🔧 Loading all drivers...")
         
-        for driver_name in self.drivers.keys():
-            self.load_driver(driver_name)
+        pending = []
+        for driver_name in self._driver_classes:
+            if self._instantiate(driver_name).loaded:
+                self.load_driver(driver_name)  # reports "already loaded"
+            else:
+                pending.append(driver_name)
+        
+        # Driver loads are independent, so run them concurrently; each one
+        # logs into its own list, printed afterwards in registration order
+        if pending:
+            messages = {name: [] for name in pending}
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                results = list(pool.map(
+                    lambda name: self.drivers[name].load(messages[name].append), pending))
+            
+            for driver_name, success in zip(pending, results):
+                for line in messages[driver_name]:
+                    print(line)
+                if success and driver_name not in self.loaded_drivers:
+                    self.loaded_drivers.append(driver_name)
         
         print(f"✅ Loaded {len(self.loaded_drivers)} drivers")
         return True
@@ -614,33 +725,46 @@ class DriverManager:
     
     def get_driver(self, driver_name: str) -> Optional[BaseDriver]:
         """Get driver instance"""
-        return self.drivers.get(driver_name)
-    
-    def list_drivers(self) -> List[Dict]:
-        """List all drivers"""
-        driver_list = []
-        
-        for name, driver in self.drivers.items():
-            driver_list.append({
+        return self._instantiate(driver_name)
+    
+    def list_drivers(self) -> Tuple[Mapping, ...]:
+        """List all drivers (cached and shared by all callers, so a tuple of read-only views)"""
+        # Rebuild only when some driver's cached info was invalidated
+        infos = tuple(
+            self.drivers[name].get_info() if name in self.drivers else self._idle_info[name]
+            for name in self._driver_classes
+        )
+        if (self._driver_list is not None and len(infos) == len(self._driver_list_src)
+                and all(a is b for a, b in zip(infos, self._driver_list_src))):
+            return self._driver_list
+        
+        driver_list = tuple(
+            MappingProxyType({
                 'name': name,
-                'full_name': driver.name,
-                'version': driver.version,
-                'status': driver.status,
-                'loaded': driver.loaded,
-                'devices': len(driver.devices)
+                'full_name': info['name'],
+                'version': info['version'],
+                'status': info['status'],
+                'loaded': info['loaded'],
+                'devices': info['devices']
             })
+            for name, info in zip(self._driver_classes, infos)
+        )
         
+        self._driver_list = driver_list
+        self._driver_list_src = infos
         return driver_list
     
-    def get_all_devices(self) -> Dict[str, List[Dict]]:
-        """Get all devices from all drivers"""
-        all_devices = {}
-        
-        for name, driver in self.drivers.items():
-            if driver.loaded and driver.devices:
-                all_devices[name] = list(driver.devices.values())
-        
-        return all_devices
+    def get_all_devices(self) -> Dict[str, Iterable[Dict]]:
+        """Get all devices from all drivers (live views, not copies)"""
+        return {
+            name: driver.devices.values()
+            for name, driver in self.drivers.items()
+            if driver.loaded and driver.devices
+        }
+    
+    def get_all_devices_list(self) -> Dict[str, List[Dict]]:
+        """Get all devices from all drivers as materialized lists"""
+        return {name: list(devices) for name, devices in self.get_all_devices().items()}
 
 
 # ===== MAIN FOR TESTING =====
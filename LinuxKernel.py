@@ -11,22 +11,43 @@ Menggunakan mirror:
 import os
 import sys
 import json
-import pickle
-import hashlib
 import urllib.request
 import urllib.error
 import tarfile
-import lzma
-import gzip
 import shutil
-import subprocess
+import stat
+import struct
 import time
 import platform
 import sqlite3
+import functools
+import secrets
+import string
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import tempfile
+from typing import Dict, List, Optional
+from collections import deque, defaultdict
+
+# Optional C JSON codec for the container JSON columns; stdlib json otherwise
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+@functools.lru_cache(maxsize=4096)
+def _ctime(sec: int) -> str:
+    """time.ctime for a whole second, cached since listing rows often share one"""
+    return time.ctime(sec)
+
+def _json_column(raw):
+    """Decode a JSON column; NULL and the stored '[]' / '{}' give None without parsing"""
+    if not raw or raw == '[]' or raw == '{}':
+        return None
+    return _json_loads(raw)
 
 # Import driver system
 try:
@@ -45,13 +66,23 @@ class DatabaseManager:
         """Initialize SQLite database"""
         self.db_path = db_path
         self.conn = None
+        # Read-only connection for listing queries (see _open_read_conn)
+        self.ro_conn = None
+        self.has_fts = False
+        self._meta = {}
+        # Per-name lookup caches, dropped on writes to the underlying table
+        self._exists_cache = {}
+        self._index_cache = {}
         self._init_database()
     
     def _init_database(self):
         """Initialize database schema"""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            # Larger statement cache: the module reuses compiled statements
+            # keyed by SQL text, so repeated queries skip sqlite3_prepare
+            self.conn = sqlite3.connect(self.db_path, cached_statements=256)
             self.conn.row_factory = sqlite3.Row
+            self._apply_pragmas()
             cursor = self.conn.cursor()
             
             # Table for installed packages
@@ -77,6 +108,11 @@ class DatabaseManager:
                 )
             ''')
             
+            # Indexes for orphan detection and dependency cleanup; the
+            # (package, depends_on) primary key already covers lookups by package
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_pkg_auto ON packages(auto_installed)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_deps_depends_on ON dependencies(depends_on)')
+            
             # Table for metadata
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS metadata (
@@ -97,16 +133,73 @@ class DatabaseManager:
                 )
             ''')
             
+            # Package index (parsed APKINDEX / fallback index)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS package_index (
+                    name TEXT PRIMARY KEY,
+                    version TEXT,
+                    architecture TEXT,
+                    description TEXT,
+                    size INTEGER,
+                    filename TEXT,
+                    license TEXT,
+                    url TEXT,
+                    depends TEXT
+                )
+            ''')
+            
+            # Full-text index over package_index for search
+            try:
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS package_index_fts USING fts5(
+                        name, description,
+                        content='package_index', tokenize='unicode61'
+                    )
+                ''')
+                self.has_fts = True
+            except sqlite3.OperationalError:
+                self.has_fts = False
+            
             self.conn.commit()
+            self.ro_conn = self._open_read_conn()
+            self.load_metadata()
+            self.invalidate_caches()
             
         except sqlite3.Error as e:
             print(f"⚠️  Database initialization error: {e}")
+            self.ro_conn = self.ro_conn or self.conn
+    
+    def _open_read_conn(self):
+        """Open a read-only connection; under WAL its reads never wait on writers"""
+        try:
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, cached_statements=256,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            return conn
+        except sqlite3.Error:
+            return self.conn
+    
+    def _apply_pragmas(self):
+        """Tune the connection for a local single-process database"""
+        pragmas = [
+            'PRAGMA journal_mode=WAL',
+            'PRAGMA synchronous=NORMAL',
+            'PRAGMA temp_store=MEMORY',
+            'PRAGMA cache_size=-65536',      # 64 MiB
+            'PRAGMA mmap_size=268435456',    # 256 MiB
+        ]
+        for pragma in pragmas:
+            try:
+                self.conn.execute(pragma)
+            except sqlite3.Error as e:
+                # Some builds (e.g. Termux) lack mmap or WAL support
+                print(f"⚠️  {pragma} not applied: {e}")
     
     def get_package(self, name: str) -> Optional[Dict]:
         """Get package info"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM packages WHERE name = ?', (name,))
+            cursor = self.conn.execute('SELECT * FROM packages WHERE name = ?', (name,))
             row = cursor.fetchone()
             if row:
                 return dict(row)
@@ -119,38 +212,89 @@ class DatabaseManager:
                     auto_installed: bool = False, simulated: bool = False):
         """Add package to database"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            self.conn.execute('''
                 INSERT OR REPLACE INTO packages 
                 (name, version, size, filename, installed_time, auto_installed, simulated)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (name, version, size, filename, time.time(), 
                   1 if auto_installed else 0, 1 if simulated else 0))
             self.conn.commit()
+            self._exists_cache.pop(name, None)
             return True
         except sqlite3.Error as e:
             print(f"⚠️  Error adding package: {e}")
             return False
     
+    def add_package_if_absent(self, name: str, version: str, size: int, filename: str,
+                              auto_installed: bool = False, simulated: bool = False) -> bool:
+        """Insert package unless present; True if a new row was added, None on error"""
+        # OR IGNORE + rowcount rather than RETURNING, which needs SQLite 3.35+
+        try:
+            cursor = self.conn.execute('''
+                INSERT OR IGNORE INTO packages 
+                (name, version, size, filename, installed_time, auto_installed, simulated)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (name, version, size, filename, time.time(),
+                  1 if auto_installed else 0, 1 if simulated else 0))
+            inserted = cursor.rowcount == 1
+            self.conn.commit()
+            self._exists_cache[name] = True
+            return inserted
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"⚠️  Error adding package: {e}")
+            return None
+    
     def remove_package(self, name: str):
         """Remove package from database"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM packages WHERE name = ?', (name,))
-            cursor.execute('DELETE FROM dependencies WHERE package = ? OR depends_on = ?', 
-                          (name, name))
+            self.conn.execute('DELETE FROM packages WHERE name = ?', (name,))
+            self.conn.execute('DELETE FROM dependencies WHERE package = ? OR depends_on = ?', 
+                              (name, name))
             self.conn.commit()
+            self._exists_cache.pop(name, None)
             return True
         except sqlite3.Error as e:
             print(f"⚠️  Error removing package: {e}")
             return False
     
-    def get_all_packages(self) -> List[Dict]:
-        """Get all installed packages"""
+    def get_package_sizes(self, names: List[str]) -> Dict[str, int]:
+        """Get {name: size} for several packages in as few queries as possible"""
+        sizes = {}
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM packages ORDER BY name')
-            return [dict(row) for row in cursor.fetchall()]
+            # Stay well below SQLite's bound-variable limit
+            for start in range(0, len(names), 500):
+                chunk = names[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = self.conn.execute(
+                    f'SELECT name, size FROM packages WHERE name IN ({placeholders})', chunk)
+                sizes.update(cursor.fetchall())
+            return sizes
+        except sqlite3.Error as e:
+            print(f"⚠️  Error getting packages: {e}")
+            return sizes
+    
+    def remove_packages(self, names: List[str]):
+        """Remove several packages (and their dependency rows) in one transaction"""
+        rows = [(name,) for name in names]
+        try:
+            with self.conn:
+                self.conn.executemany('DELETE FROM packages WHERE name = ?', rows)
+                self.conn.executemany('DELETE FROM dependencies WHERE package = ?', rows)
+                self.conn.executemany('DELETE FROM dependencies WHERE depends_on = ?', rows)
+            for name in names:
+                self._exists_cache.pop(name, None)
+            return True
+        except sqlite3.Error as e:
+            print(f"⚠️  Error removing packages: {e}")
+            return False
+    
+    def get_all_packages(self) -> List[sqlite3.Row]:
+        """Get all installed packages, ordered by name (primary key order)"""
+        try:
+            cursor = self.ro_conn.execute(
+                'SELECT name, version, size, installed_time FROM packages ORDER BY name')
+            return cursor.fetchall()
         except sqlite3.Error as e:
             print(f"⚠️  Error getting packages: {e}")
             return []
@@ -158,8 +302,7 @@ class DatabaseManager:
     def add_dependency(self, package: str, depends_on: str):
         """Add dependency relationship"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            self.conn.execute('''
                 INSERT OR IGNORE INTO dependencies (package, depends_on)
                 VALUES (?, ?)
             ''', (package, depends_on))
@@ -169,28 +312,67 @@ class DatabaseManager:
             print(f"⚠️  Error adding dependency: {e}")
             return False
     
+    def add_dependencies_bulk(self, rows: List[tuple], metadata: List[tuple] = None):
+        """Add many (package, depends_on) pairs, plus optional metadata, in one transaction"""
+        try:
+            with self.conn:
+                self.conn.executemany('''
+                    INSERT OR IGNORE INTO dependencies (package, depends_on)
+                    VALUES (?, ?)
+                ''', rows)
+                if metadata:
+                    self.conn.executemany('''
+                        INSERT OR REPLACE INTO metadata (key, value)
+                        VALUES (?, ?)
+                    ''', metadata)
+            if metadata:
+                self._meta.update(metadata)
+            return True
+        except sqlite3.Error as e:
+            print(f"⚠️  Error adding dependencies: {e}")
+            return False
+    
     def get_orphaned_packages(self) -> List[str]:
         """Find orphaned packages (auto-installed but no longer needed)"""
         try:
-            cursor = self.conn.cursor()
-            # Get all auto-installed packages
-            cursor.execute('SELECT name FROM packages WHERE auto_installed = 1')
-            auto_installed = [row[0] for row in cursor.fetchall()]
-            
-            # Get all manually installed packages
-            cursor.execute('SELECT name FROM packages WHERE auto_installed = 0')
-            manually_installed = [row[0] for row in cursor.fetchall()]
-            
-            # Get all dependencies of manually installed packages
-            needed = set()
-            for pkg in manually_installed:
-                cursor.execute('''
-                    SELECT depends_on FROM dependencies WHERE package = ?
-                ''', (pkg,))
-                needed.update([row[0] for row in cursor.fetchall()])
+            cursor = self.conn.execute('SELECT name, auto_installed FROM packages')
+            auto = {row[0]: row[1] for row in cursor.fetchall()}
+            
+            # Reverse-dependency graph: package -> packages depending on it
+            revdeps = defaultdict(list)
+            for depends_on, package in self.conn.execute(
+                    'SELECT depends_on, package FROM dependencies'):
+                if package in auto:
+                    revdeps[depends_on].append(package)
+            
+            # BFS up the revdeps of each candidate, stopping at the first
+            # manually installed (or already known-needed) package. If nothing
+            # needs it, nothing in its visited set is needed either.
+            needed = {}
+            orphaned = []
+            for pkg, is_auto in auto.items():
+                if not is_auto:
+                    continue
+                if pkg not in needed:
+                    visited = {pkg}
+                    queue = deque([pkg])
+                    found = False
+                    while queue and not found:
+                        for rdep in revdeps.get(queue.popleft(), ()):
+                            if not auto[rdep] or needed.get(rdep):
+                                found = True
+                                break
+                            if rdep not in visited:
+                                visited.add(rdep)
+                                queue.append(rdep)
+                    if found:
+                        needed[pkg] = True
+                    else:
+                        for name in visited:
+                            needed[name] = False
+                if not needed[pkg]:
+                    orphaned.append(pkg)
             
-            # Orphaned = auto-installed but not needed
-            orphaned = [pkg for pkg in auto_installed if pkg not in needed]
             return orphaned
             
         except sqlite3.Error as e:
@@ -198,30 +380,56 @@ class DatabaseManager:
             return []
     
     # Hidden filesystem operations
+    # Chunk size for incremental BLOB I/O (Connection.blobopen, Python 3.11+)
+    BLOB_CHUNK = 1024 * 1024
+    
     def write_hidden_file(self, path: str, content: bytes):
         """Write to hidden filesystem"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            if not hasattr(self.conn, 'blobopen'):
+                self.conn.execute('''
+                    INSERT OR REPLACE INTO hidden_files 
+                    (path, content, size, created_time, modified_time)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (path, content, len(content), time.time(), time.time()))
+                self.conn.commit()
+                return True
+            
+            # Reserve a zero-filled BLOB, then stream the content into it
+            cursor = self.conn.execute('''
                 INSERT OR REPLACE INTO hidden_files 
                 (path, content, size, created_time, modified_time)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (path, content, len(content), time.time(), time.time()))
+                VALUES (?, zeroblob(?), ?, ?, ?)
+            ''', (path, len(content), len(content), time.time(), time.time()))
+            if content:
+                view = memoryview(content)
+                with self.conn.blobopen('hidden_files', 'content', cursor.lastrowid) as blob:
+                    for offset in range(0, len(view), self.BLOB_CHUNK):
+                        blob.write(view[offset:offset + self.BLOB_CHUNK])
             self.conn.commit()
             return True
         except sqlite3.Error as e:
+            self.conn.rollback()
             print(f"⚠️  Error writing hidden file: {e}")
             return False
     
     def read_hidden_file(self, path: str) -> Optional[bytes]:
         """Read from hidden filesystem"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT content FROM hidden_files WHERE path = ?', (path,))
+            cursor = self.conn.execute(
+                'SELECT rowid, length(content) FROM hidden_files WHERE path = ?', (path,))
             row = cursor.fetchone()
-            if row:
-                return row[0]
-            return None
+            if not row:
+                return None
+            if not row[1]:
+                return b''
+            if not hasattr(self.conn, 'blobopen'):
+                cursor = self.conn.execute('SELECT content FROM hidden_files WHERE rowid = ?', (row[0],))
+                return cursor.fetchone()[0]
+            
+            # Read straight from the BLOB pages instead of via a result row
+            with self.conn.blobopen('hidden_files', 'content', row[0], readonly=True) as blob:
+                return blob.read()
         except sqlite3.Error as e:
             print(f"⚠️  Error reading hidden file: {e}")
             return None
@@ -229,8 +437,7 @@ class DatabaseManager:
     def list_hidden_files(self) -> List[Dict]:
         """List all hidden files"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT path, size, modified_time FROM hidden_files ORDER BY path')
+            cursor = self.ro_conn.execute('SELECT path, size, modified_time FROM hidden_files ORDER BY path')
             return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             print(f"⚠️  Error listing hidden files: {e}")
@@ -239,39 +446,147 @@ class DatabaseManager:
     def delete_hidden_file(self, path: str):
         """Delete hidden file"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM hidden_files WHERE path = ?', (path,))
+            self.conn.execute('DELETE FROM hidden_files WHERE path = ?', (path,))
             self.conn.commit()
             return True
         except sqlite3.Error as e:
             print(f"⚠️  Error deleting hidden file: {e}")
             return False
     
+    def load_metadata(self):
+        """(Re)load the in-memory metadata cache from SQLite"""
+        try:
+            self._meta = dict(self.conn.execute('SELECT key, value FROM metadata').fetchall())
+        except sqlite3.Error as e:
+            self._meta = {}
+            print(f"⚠️  Error loading metadata: {e}")
+    
     def set_metadata(self, key: str, value: str):
         """Set metadata value"""
+        return self.set_metadata_many([(key, value)])
+    
+    def set_metadata_many(self, items: List[tuple]):
+        """Set several metadata values in a single transaction"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            self.conn.executemany('''
                 INSERT OR REPLACE INTO metadata (key, value)
                 VALUES (?, ?)
-            ''', (key, value))
+            ''', items)
             self.conn.commit()
+            self._meta.update(items)
             return True
         except sqlite3.Error as e:
             print(f"⚠️  Error setting metadata: {e}")
             return False
     
     def get_metadata(self, key: str) -> Optional[str]:
-        """Get metadata value"""
+        """Get metadata value (served from the write-through cache)"""
+        return self._meta.get(key)
+    
+    def replace_package_index(self, rows) -> int:
+        """Replace the package index with rows in a single transaction"""
+        # rows is usually a lazy parser generator; `with` also rolls back when
+        # it raises (tarfile/decode errors), not only on sqlite3.Error
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT value FROM metadata WHERE key = ?', (key,))
+            with self.conn:
+                self.conn.execute('DELETE FROM package_index')
+                self.conn.executemany('''
+                    INSERT OR REPLACE INTO package_index 
+                    (name, version, architecture, description, size, filename, license, url, depends)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                if self.has_fts:
+                    self.conn.execute("INSERT INTO package_index_fts(package_index_fts) VALUES('rebuild')")
+            self._index_cache.clear()
+            return self.conn.execute('SELECT COUNT(*) FROM package_index').fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"⚠️  Error updating package index: {e}")
+            return 0
+    
+    @staticmethod
+    def _fts_match(terms: List[str]) -> str:
+        """Build an FTS5 query: every term as a quoted prefix token, ANDed"""
+        return ' '.join('"' + t.replace('"', '""') + '"*' for t in terms)
+    
+    @staticmethod
+    def _like_pattern(query: str) -> str:
+        """Build a LIKE substring pattern in which %, _ and \\ match literally"""
+        escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f"%{escaped}%"
+    
+    def search_package_index(self, query: str) -> List[Dict]:
+        """Search package index by name/description"""
+        terms = query.split()
+        try:
+            if self.has_fts and terms:
+                match = self._fts_match(terms)
+                cursor = self.conn.execute('''
+                    SELECT i.name, i.version, i.description, i.size,
+                           p.name IS NOT NULL AS installed
+                    FROM package_index_fts f
+                    JOIN package_index i ON i.rowid = f.rowid
+                    LEFT JOIN packages p ON p.name = i.name
+                    WHERE package_index_fts MATCH ?
+                    ORDER BY i.name
+                ''', (match,))
+            else:
+                pattern = self._like_pattern(query)
+                cursor = self.conn.execute('''
+                    SELECT i.name, i.version, i.description, i.size,
+                           p.name IS NOT NULL AS installed
+                    FROM package_index i
+                    LEFT JOIN packages p ON p.name = i.name
+                    WHERE i.name LIKE ? ESCAPE '\\' OR i.description LIKE ? ESCAPE '\\'
+                    ORDER BY i.name
+                ''', (pattern, pattern))
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"⚠️  Error searching package index: {e}")
+            return []
+    
+    def search_package_names(self, query: str, limit: int = 5) -> List[tuple]:
+        """Search package index, returning only (name, short description)"""
+        terms = query.split()
+        try:
+            if self.has_fts and terms:
+                cursor = self.conn.execute('''
+                    SELECT i.name, substr(i.description, 1, 50)
+                    FROM package_index_fts f
+                    JOIN package_index i ON i.rowid = f.rowid
+                    WHERE package_index_fts MATCH ?
+                    ORDER BY i.name LIMIT ?
+                ''', (self._fts_match(terms), limit))
+            else:
+                pattern = self._like_pattern(query)
+                cursor = self.conn.execute('''
+                    SELECT name, substr(description, 1, 50) FROM package_index
+                    WHERE name LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\'
+                    ORDER BY name LIMIT ?
+                ''', (pattern, pattern, limit))
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️  Error searching package index: {e}")
+            return []
+    
+    def has_package_index(self) -> bool:
+        """Check whether the package index has any entries"""
+        try:
+            return self.conn.execute('SELECT 1 FROM package_index LIMIT 1').fetchone() is not None
+        except sqlite3.Error:
+            return False
+    
+    def get_index_entry(self, name: str) -> Optional[Dict]:
+        """Get a single package index entry"""
+        if name in self._index_cache:
+            return self._index_cache[name]
+        try:
+            cursor = self.conn.execute('SELECT * FROM package_index WHERE name = ?', (name,))
             row = cursor.fetchone()
-            if row:
-                return row[0]
-            return None
+            entry = dict(row) if row else None
+            self._cache_put(self._index_cache, name, entry)
+            return entry
         except sqlite3.Error as e:
-            print(f"⚠️  Error getting metadata: {e}")
+            print(f"⚠️  Error reading package index: {e}")
             return None
     
     def repair(self) -> bool:
@@ -279,14 +594,26 @@ class DatabaseManager:
         print("🔧 Starting database repair...")
         
         try:
-            # Close current connection
+            # Close current connections
+            if self.ro_conn and self.ro_conn is not self.conn:
+                self.ro_conn.close()
+            self.ro_conn = None
             if self.conn:
                 self.conn.close()
             
-            # Backup corrupted database
+            # Backup corrupted database (hard link is O(1); the repaired
+            # file replaces db_path under a new inode, so the link stays intact)
             backup_path = f"{self.db_path}.backup.{int(time.time())}"
             if os.path.exists(self.db_path):
-                shutil.copy2(self.db_path, backup_path)
+                try:
+                    os.link(self.db_path, backup_path)
+                except OSError:
+                    try:
+                        backup_conn = sqlite3.connect(self.db_path)
+                        backup_conn.execute('VACUUM INTO ?', (backup_path,))
+                        backup_conn.close()
+                    except sqlite3.Error:
+                        shutil.copy2(self.db_path, backup_path)
                 print(f"📋 Backup created: {backup_path}")
             
             # Try to recover data using sqlite3 recovery
@@ -301,12 +628,25 @@ class DatabaseManager:
                 # Create new database
                 new_conn = sqlite3.connect(temp_db)
                 
-                # Dump schema and data
-                for line in old_conn.iterdump():
-                    try:
-                        new_conn.execute(line)
-                    except sqlite3.Error:
-                        continue
+                # Page-level copy first; fall back to a SQL dump if the
+                # copied pages are still corrupt
+                try:
+                    old_conn.backup(new_conn)
+                    copied_ok = new_conn.execute('PRAGMA integrity_check').fetchone()[0] == 'ok'
+                except sqlite3.Error:
+                    copied_ok = False
+                
+                if not copied_ok:
+                    new_conn.close()
+                    os.remove(temp_db)
+                    new_conn = sqlite3.connect(temp_db)
+                    
+                    # Dump schema and data
+                    for line in old_conn.iterdump():
+                        try:
+                            new_conn.execute(line)
+                        except sqlite3.Error:
+                            continue
                 
                 new_conn.commit()
                 new_conn.close()
@@ -336,28 +676,46 @@ class DatabaseManager:
     
     def check_package_exists(self, name: str) -> bool:
         """Check if package exists"""
+        if name in self._exists_cache:
+            return self._exists_cache[name]
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT name FROM packages WHERE name = ?', (name,))
-            return cursor.fetchone() is not None
+            cursor = self.conn.execute('SELECT 1 FROM packages WHERE name = ? LIMIT 1', (name,))
+            exists = cursor.fetchone() is not None
+            self._cache_put(self._exists_cache, name, exists)
+            return exists
         except sqlite3.Error:
             return False
     
+    CACHE_SIZE = 1024
+    
+    def _cache_put(self, cache: Dict, key, value):
+        """Store in a lookup cache, starting over once it is full"""
+        if len(cache) >= self.CACHE_SIZE:
+            cache.clear()
+        cache[key] = value
+    
+    def invalidate_caches(self):
+        """Drop all per-name lookup caches"""
+        self._exists_cache.clear()
+        self._index_cache.clear()
+    
     def remove_package_safe(self, name: str) -> bool:
         """Safely remove package (no error if not exists)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM packages WHERE name = ?', (name,))
-            cursor.execute('DELETE FROM dependencies WHERE package = ? OR depends_on = ?', 
-                          (name, name))
+            self.conn.execute('DELETE FROM packages WHERE name = ?', (name,))
+            self.conn.execute('DELETE FROM dependencies WHERE package = ? OR depends_on = ?', 
+                              (name, name))
             self.conn.commit()
+            self._exists_cache.pop(name, None)
             return True
         except sqlite3.Error as e:
             print(f"⚠️  Error removing package: {e}")
             return False
     
     def close(self):
-        """Close database connection"""
+        """Close database connections"""
+        if self.ro_conn and self.ro_conn is not self.conn:
+            self.ro_conn.close()
         if self.conn:
             self.conn.close()
 
@@ -374,6 +732,18 @@ class AddPackageManager:
         "https://mirror.archlinux.tw/ArchLinux/"
     ]
     
+    ARCH_MAP = {
+        'aarch64': 'aarch64',
+        'armv8l': 'aarch64',
+        'armv7l': 'arm',
+        'i686': 'i686',
+        'x86_64': 'x86_64',
+        'amd64': 'amd64'
+    }
+    
+    # Read size when streaming APKINDEX records
+    APK_READ_SIZE = 1024 * 1024
+    
     def __init__(self, prefix: str = None):
         """Inisialisasi package manager"""
         self.arch = self._detect_architecture()
@@ -389,31 +759,22 @@ class AddPackageManager:
         db_path = f"{self.prefix}/var/lib/add/.kernel.db"  # Hidden database
         self.db_manager = DatabaseManager(db_path)
         
-        self.index_file = f"{self.prefix}/var/cache/add/index.json"
-        
         # Initialize metadata
         if not self.db_manager.get_metadata('version'):
-            self.db_manager.set_metadata('version', '1.0.0')
-            self.db_manager.set_metadata('architecture', self.arch)
-            for i, mirror in enumerate(self.MIRRORS):
-                self.db_manager.set_metadata(f'mirror_{i}', mirror)
+            # Mirrors are not stored: MIRRORS is the single source of truth
+            self.db_manager.set_metadata_many([('version', '1.0.0'), ('architecture', self.arch)])
         
-        self.packages_index = {}
-        self.mirror_idx = 0
-        self.current_mirror = self.MIRRORS[0]
+        # Last mirror that worked (persisted across sessions)
+        saved_idx = self.db_manager.get_metadata('mirror_idx')
+        self.mirror_idx = int(saved_idx) % len(self.MIRRORS) if saved_idx else 0
+        self.current_mirror = self.MIRRORS[self.mirror_idx]
     
-    def _detect_architecture(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _detect_architecture() -> str:
         """Deteksi architecture sistem"""
         machine = platform.machine().lower()
-        arch_map = {
-            'aarch64': 'aarch64',
-            'armv8l': 'aarch64',
-            'armv7l': 'arm',
-            'i686': 'i686',
-            'x86_64': 'x86_64',
-            'amd64': 'amd64'
-        }
-        return arch_map.get(machine, 'aarch64')
+        return AddPackageManager.ARCH_MAP.get(machine, 'aarch64')
     
     def _create_directories(self):
         """Buat struktur direktori"""
@@ -438,84 +799,78 @@ class AddPackageManager:
         # Try Alpine mirror first (most reliable for our use case)
         print("📦 Fetching from Alpine Linux mirror...")
         alpine_url = "https://dl-cdn.alpinelinux.org/alpine/v3.19/main/x86_64/APKINDEX.tar.gz"
-        packages_local = f"{self.prefix}/var/cache/add/APKINDEX.tar.gz"
         
-        if self._download_direct(alpine_url, packages_local):
-            if self._parse_apkindex(packages_local):
-                print(f"✅ Package list updated from Alpine Linux")
-                return True
+        if self._stream_apkindex(alpine_url):
+            print(f"✅ Package list updated from Alpine Linux")
+            return True
         
         # Fallback to dummy if Alpine fails
         print("⚠️  Alpine mirror failed, using fallback dummy index")
         self._create_dummy_index()
         return True
     
-    def _download_direct(self, url: str, dest: str) -> bool:
-        """Download file directly (without mirror rotation)"""
+    def _stream_apkindex(self, url: str) -> bool:
+        """Download and parse APKINDEX.tar.gz in one pass (no temp file)"""
         try:
             print(f"   Downloading {url}...")
-            req = urllib.request.Request(
-                url,
-                headers={'User-Agent': 'kernel-add/1.0'}
-            )
+            headers = {'User-Agent': 'kernel-add/1.0'}
+            
+            # Conditional GET: the mirror answers 304 if the index is unchanged
+            if self.db_manager.has_package_index():
+                etag = self.db_manager.get_metadata('apkindex_etag')
+                last_modified = self.db_manager.get_metadata('apkindex_last_modified')
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            req = urllib.request.Request(url, headers=headers)
             
             with urllib.request.urlopen(req, timeout=30) as response:
-                total_size = int(response.headers.get('content-length', 0))
+                if not self._parse_apkindex(fileobj=response):
+                    return False
                 
-                with open(dest, 'wb') as f:
-                    downloaded = 0
-                    chunk_size = 8192
-                    
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            bar_length = 30
-                            filled = int(bar_length * downloaded // total_size)
-                            bar = '█' * filled + '░' * (bar_length - filled)
-                            print(f"\r   [{bar}] {percent:.1f}%", end='', flush=True)
-                    
-                    print()  # New line after progress
-            
-            return True
+                self.db_manager.set_metadata_many([
+                    ('apkindex_etag', response.headers.get('ETag', '')),
+                    ('apkindex_last_modified', response.headers.get('Last-Modified', ''))
+                ])
+                return True
             
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                print(f"   ✅ Package index not modified, keeping cached copy")
+                return True
+            print(f"   ❌ Download failed: {e}")
+            return False
         except Exception as e:
-            print(f"\r   ❌ Download failed: {e}")
+            print(f"   ❌ Download failed: {e}")
             return False
     
-    def _parse_apkindex(self, apkindex_path: str) -> bool:
-        """Parse Alpine APKINDEX.tar.gz file"""
+    def _parse_apkindex(self, apkindex_path: str = None, fileobj=None) -> bool:
+        """Parse Alpine APKINDEX.tar.gz from a path or a non-seekable stream"""
         try:
-            import tarfile
-            
             print(f"   Parsing APKINDEX...")
-            packages = {}
+            count = 0
+            
+            # 'r|gz' decompresses as the stream arrives; 'r:gz' needs a seekable file
+            if fileobj is not None:
+                tar = tarfile.open(fileobj=fileobj, mode='r|gz')
+            else:
+                tar = tarfile.open(apkindex_path, 'r:gz')
             
-            # Extract APKINDEX from tar.gz
-            with tarfile.open(apkindex_path, 'r:gz') as tar:
+            with tar:
                 # APKINDEX file is usually named just "APKINDEX"
-                for member in tar.getmembers():
+                for member in tar:
                     if 'APKINDEX' in member.name and member.isfile():
                         f = tar.extractfile(member)
                         if f:
-                            content = f.read().decode('utf-8', errors='ignore')
-                            packages = self._parse_apkindex_content(content)
+                            # Stream byte lines straight from the archive into executemany
+                            count = self.db_manager.replace_package_index(
+                                self._parse_apkindex_content(f))
                             break
             
-            if packages:
-                self.packages_index = packages
-                
-                # Save to JSON cache
-                with open(self.index_file, 'w') as f:
-                    json.dump(packages, f, indent=2)
-                
-                print(f"   ✅ Parsed {len(packages)} packages from Alpine")
+            if count:
+                print(f"   ✅ Parsed {count} packages from Alpine")
                 return True
             
             return False
@@ -524,39 +879,61 @@ class AddPackageManager:
             print(f"   ⚠️  Error parsing APKINDEX: {e}")
             return False
     
-    def _parse_apkindex_content(self, content: str) -> Dict:
-        """Parse APKINDEX content into package dict"""
-        packages = {}
-        current_pkg = {}
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            
-            if line == '':
-                # Empty line = end of package entry
-                if current_pkg and 'P' in current_pkg:
-                    pkg_name = current_pkg['P']
-                    
-                    # Convert to our format
-                    packages[pkg_name] = {
-                        'Package': pkg_name,
-                        'Version': current_pkg.get('V', 'unknown'),
-                        'Architecture': current_pkg.get('A', 'x86_64'),
-                        'Description': current_pkg.get('T', 'No description'),
-                        'Size': int(current_pkg.get('S', 0)),
-                        'Filename': f"{pkg_name}-{current_pkg.get('V', '0')}.apk",
-                        'License': current_pkg.get('L', 'unknown'),
-                        'URL': current_pkg.get('U', ''),
-                        'Depends': current_pkg.get('D', '')
-                    }
-                
-                current_pkg = {}
-            
-            elif ':' in line:
-                key, value = line.split(':', 1)
-                current_pkg[key] = value.strip()
+    def _parse_apkindex_content(self, stream):
+        """Parse an APKINDEX byte stream, yielding package_index rows"""
+        pending = b''
         
-        return packages
+        while True:
+            block = stream.read(self.APK_READ_SIZE)
+            # Empty line = end of package entry; keep the partial tail for the next block
+            records = (pending + block).split(b'\n\n')
+            pending = records.pop() if block else b''
+            
+            for record in records:
+                # Keep raw bytes; only the fields we store get decoded
+                fields = {line[:1]: line[2:] for line in record.split(b'\n') if line[1:2] == b':'}
+                if b'P' in fields:
+                    yield self._apk_row(fields)
+            
+            if not block:
+                break
+    
+    @staticmethod
+    def _apk_row(pkg: Dict) -> tuple:
+        """Convert raw APKINDEX fields into a package_index row"""
+        def field(key, default):
+            value = pkg.get(key)
+            if value is None:
+                return default
+            return value.decode('utf-8', errors='ignore').strip()
+        
+        pkg_name = field(b'P', '')
+        return (
+            pkg_name,
+            field(b'V', 'unknown'),
+            field(b'A', 'x86_64'),
+            field(b'T', 'No description'),
+            int(field(b'S', '0') or 0),
+            f"{pkg_name}-{field(b'V', '0')}.apk",
+            field(b'L', 'unknown'),
+            field(b'U', ''),
+            field(b'D', '')
+        )
+    
+    @staticmethod
+    def _index_row(pkg: Dict) -> tuple:
+        """Convert a Packages-style dict into a package_index row"""
+        return (
+            pkg['Package'],
+            pkg.get('Version', 'unknown'),
+            pkg.get('Architecture', 'all'),
+            pkg.get('Description', 'No description'),
+            int(pkg.get('Size', 0)),
+            pkg.get('Filename', ''),
+            pkg.get('License', 'unknown'),
+            pkg.get('URL', ''),
+            pkg.get('Depends', '')
+        )
     
     def _parse_packages(self, packages_path: str) -> bool:
         """Parse Packages file"""
@@ -579,10 +956,8 @@ class AddPackageManager:
                         current_pkg[key] = value
             
             if packages:
-                self.packages_index = packages
-                
-                with open(self.index_file, 'w') as f:
-                    json.dump(packages, f, indent=2)
+                self.db_manager.replace_package_index(
+                    self._index_row(pkg) for pkg in packages.values())
                 
                 print(f"✅ Package list updated: {len(packages)} packages")
                 return True
@@ -694,79 +1069,51 @@ class AddPackageManager:
             }
         }
         
-        self.packages_index = dummy_packages
-        
-        with open(self.index_file, 'w') as f:
-            json.dump(dummy_packages, f, indent=2)
+        self.db_manager.replace_package_index(
+            self._index_row(pkg) for pkg in dummy_packages.values())
+        # The cached index is no longer the mirror's copy
+        self.db_manager.set_metadata_many([('apkindex_etag', ''), ('apkindex_last_modified', '')])
         
         print(f"📦 Fallback index created with {len(dummy_packages)} packages")
         print(f"💡 Run 'update' again to fetch from real Alpine mirror")
     
     def search(self, query: str) -> List[Dict]:
         """Search packages"""
-        if not self.packages_index:
-            if os.path.exists(self.index_file):
-                try:
-                    with open(self.index_file, 'r') as f:
-                        self.packages_index = json.load(f)
-                except:
-                    return []
-        
         results = []
-        query_lower = query.lower()
         
-        for pkg_name, pkg_info in self.packages_index.items():
-            if (query_lower in pkg_name.lower() or 
-                query_lower in pkg_info.get('Description', '').lower()):
-                
-                # Check if installed using SQLite
-                installed = self.db_manager.get_package(pkg_name) is not None
-                
-                results.append({
-                    'name': pkg_name,
-                    'version': pkg_info.get('Version', 'unknown'),
-                    'description': pkg_info.get('Description', 'No description'),
-                    'size': int(pkg_info.get('Size', 0)),
-                    'installed': installed,
-                    'status': '✓' if installed else ' '
-                })
+        # Index lookup + installed check happen in one SQLite query
+        for row in self.db_manager.search_package_index(query):
+            installed = bool(row['installed'])
+            results.append({
+                'name': row['name'],
+                'version': row['version'] or 'unknown',
+                'description': row['description'] or 'No description',
+                'size': row['size'] or 0,
+                'installed': installed,
+                'status': '✓' if installed else ' '
+            })
         
-        return sorted(results, key=lambda x: x['name'])
+        return results
     
     def install(self, package_name: str, simulate: bool = False) -> bool:
         """Install package (or simulate)"""
         print(f"📦 Installing {package_name}...")
         
-        # Check if already installed using SQLite
-        if self.db_manager.get_package(package_name):
-            print(f"⚠️  {package_name} is already installed")
-            return True
-        
         pkg_info = self._get_package_info(package_name)
         if not pkg_info:
+            if self.db_manager.check_package_exists(package_name):
+                print(f"⚠️  {package_name} is already installed")
+                return True
             print(f"❌ Package {package_name} not found")
-            results = self.search(package_name)
+            results = self.db_manager.search_package_names(package_name, limit=5)
             if results:
                 print("Did you mean:")
-                for i, pkg in enumerate(results[:5], 1):
-                    print(f"  {i}. {pkg['name']} - {pkg['description'][:50]}...")
+                for i, (name, description) in enumerate(results, 1):
+                    print(f"  {i}. {name} - {description}...")
             return False
         
-        if simulate:
-            print(f"✅ [SIMULATED] {package_name} would be installed")
-            print(f"   Version: {pkg_info.get('Version')}")
-            print(f"   Size: {int(pkg_info.get('Size', 0)):,} bytes")
-        else:
-            # Simulate installation
-            print(f"📥 Downloading {package_name}...")
-            time.sleep(0.5)
-            print(f"📂 Extracting package...")
-            time.sleep(0.3)
-            print(f"⚙️  Configuring {package_name}...")
-            time.sleep(0.2)
-        
-        # Add to SQLite database
-        self.db_manager.add_package(
+        # Claim the row in SQLite; nothing inserted means already installed
+        claimed = self.db_manager.add_package_if_absent(
             name=package_name,
             version=pkg_info.get('Version', 'unknown'),
             size=int(pkg_info.get('Size', 0)),
@@ -774,17 +1121,40 @@ class AddPackageManager:
             auto_installed=False,
             simulated=simulate
         )
+        if claimed is None:
+            print(f"❌ Failed to install {package_name}")
+            return False
+        if not claimed:
+            print(f"⚠️  {package_name} is already installed")
+            return True
         
-        # Add dependencies
+        if simulate:
+            print(f"✅ [SIMULATED] {package_name} would be installed")
+            print(f"   Version: {pkg_info.get('Version')}")
+            print(f"   Size: {int(pkg_info.get('Size', 0)):,} bytes")
+        else:
+            # Simulate installation; give the row back if it does not finish
+            try:
+                print(f"📥 Downloading {package_name}...")
+                time.sleep(0.5)
+                print(f"📂 Extracting package...")
+                time.sleep(0.3)
+                print(f"⚙️  Configuring {package_name}...")
+                time.sleep(0.2)
+            except BaseException:
+                self.db_manager.remove_package(package_name)
+                raise
+        
+        # Add dependencies and update metadata in one transaction
+        dep_rows = []
         depends = pkg_info.get('Depends', '')
         if depends:
             for dep in depends.split(', '):
                 dep_clean = dep.split('(')[0].strip()
                 if dep_clean:
-                    self.db_manager.add_dependency(package_name, dep_clean)
-        
-        # Update metadata
-        self.db_manager.set_metadata('last_update', str(time.time()))
+                    dep_rows.append((package_name, dep_clean))
+        self.db_manager.add_dependencies_bulk(
+            dep_rows, metadata=[('last_update', str(time.time()))])
         
         print(f"✅ {package_name} installed successfully!")
         return True
@@ -814,13 +1184,11 @@ class AddPackageManager:
             return True
         
         print(f"🗑️  Found {len(orphaned)} orphaned package(s):")
-        total_size = 0
+        sizes = self.db_manager.get_package_sizes(orphaned)
         for pkg_name in orphaned:
-            pkg = self.db_manager.get_package(pkg_name)
-            if pkg:
-                size = pkg.get('size', 0)
-                total_size += size
-                print(f"   - {pkg_name} ({size:,} bytes)")
+            if pkg_name in sizes:
+                print(f"   - {pkg_name} ({sizes[pkg_name] or 0:,} bytes)")
+        total_size = sum(size or 0 for size in sizes.values())
         
         print(f"\n💾 Total space to be freed: {total_size:,} bytes")
         
@@ -832,24 +1200,20 @@ class AddPackageManager:
         # Remove orphaned packages
         for pkg in orphaned:
             print(f"🗑️  Removing {pkg}...")
-            self.db_manager.remove_package(pkg)
+        self.db_manager.remove_packages(orphaned)
         
         print(f"✅ Removed {len(orphaned)} orphaned package(s)")
         return True
     
     def list_installed(self) -> List[Dict]:
         """List installed packages"""
-        packages = self.db_manager.get_all_packages()
-        installed = []
-        for pkg in packages:
-            installed.append({
-                'name': pkg['name'],
-                'version': pkg.get('version', 'unknown'),
-                'size': pkg.get('size', 0),
-                'installed': time.ctime(pkg.get('installed_time', 0))
-            })
-        
-        return sorted(installed, key=lambda x: x['name'])
+        # Already sorted by SQLite
+        return [{
+            'name': pkg['name'],
+            'version': pkg['version'] or 'unknown',
+            'size': pkg['size'] or 0,
+            'installed': _ctime(int(pkg['installed_time'] or 0))
+        } for pkg in self.db_manager.get_all_packages()]
     
     def info(self, package_name: str):
         """Show package info"""
@@ -882,6 +1246,7 @@ class AddPackageManager:
         if 0 <= index < len(self.MIRRORS):
             self.mirror_idx = index
             self.current_mirror = self.MIRRORS[index]
+            self.db_manager.set_metadata('mirror_idx', str(index))
             print(f"✅ Mirror set to: {self.current_mirror}")
             return True
         else:
@@ -895,29 +1260,36 @@ class AddPackageManager:
         
         for dir_path in [cache_dir, tmp_dir]:
             if os.path.exists(dir_path):
-                for item in os.listdir(dir_path):
-                    item_path = os.path.join(dir_path, item)
-                    try:
-                        if os.path.isfile(item_path):
-                            os.remove(item_path)
-                        elif os.path.isdir(item_path):
-                            shutil.rmtree(item_path)
-                    except:
-                        pass
+                # DirEntry type checks use readdir's d_type - no extra stat
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                shutil.rmtree(entry.path)
+                            else:
+                                os.remove(entry.path)
+                        except:
+                            pass
         
         print("🧹 Cache cleaned")
     
     def _get_package_info(self, package_name: str) -> Optional[Dict]:
         """Get package info"""
-        if not self.packages_index:
-            if os.path.exists(self.index_file):
-                try:
-                    with open(self.index_file, 'r') as f:
-                        self.packages_index = json.load(f)
-                except:
-                    return None
+        entry = self.db_manager.get_index_entry(package_name)
+        if not entry:
+            return None
         
-        return self.packages_index.get(package_name)
+        return {
+            'Package': entry['name'],
+            'Version': entry['version'],
+            'Architecture': entry['architecture'],
+            'Description': entry['description'],
+            'Size': entry['size'],
+            'Filename': entry['filename'],
+            'License': entry['license'],
+            'URL': entry['url'],
+            'Depends': entry['depends']
+        }
     
     def _download(self, url: str, dest: str) -> bool:
         """Download file with retry"""
@@ -958,6 +1330,7 @@ class AddPackageManager:
                     
                     self.mirror_idx = (self.mirror_idx + i) % len(self.MIRRORS)
                     self.current_mirror = self.MIRRORS[self.mirror_idx]
+                    self.db_manager.set_metadata('mirror_idx', str(self.mirror_idx))
                     return True
                     
                 except Exception as e:
@@ -974,6 +1347,12 @@ class AddPackageManager:
 class MiniKernel:
     """Mini Kernel untuk testing"""
     
+    # Save file format: magic, u32 header length, JSON header, then raw
+    # memory blocks and raw bytes file contents
+    STATE_MAGIC = b'LLKSTATE1\n'
+    STATE_FILE = "~/.kernel-add/kernel/state.bin"
+    LEGACY_STATE_FILE = "~/.kernel-add/kernel/state.pkl"  # pickle, older versions
+    
     def __init__(self, name="kernel-add"):
         self.name = name
         self.version = "1.0.0"
@@ -982,6 +1361,7 @@ class MiniKernel:
             'boot_time': time.time(),
             'processes': {},
             'memory': {},
+            'memory_total': 0,  # sum of memory block sizes, kept by malloc/free
             'devices': {},
             'modules': {},
             'files': {},
@@ -1004,11 +1384,24 @@ class MiniKernel:
             'pkg_list': self.sys_pkg_list
         }
         
+        # Bump allocator for memory block addresses
+        self._next_addr = 0
+        
+        # Cached "%H:%M:%S" for the current second (see _log)
+        self._log_sec = None
+        self._log_prefix = ''
+        
         self._log(f"Kernel {name} v{self.version} initialized")
     
     def _log(self, message):
         """Internal logging"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        # strftime only once per second; milliseconds appended by hand
+        now = time.time()
+        sec = int(now)
+        if sec != self._log_sec:
+            self._log_sec = sec
+            self._log_prefix = time.strftime('%H:%M:%S', time.localtime(sec))
+        timestamp = f"{self._log_prefix}.{int((now - sec) * 1000):03d}"
         log_entry = f"[{timestamp}] {message}"
         self.state['logs'].append(log_entry)
         print(f"🔵 {log_entry}")
@@ -1025,21 +1418,29 @@ class MiniKernel:
     
     def sys_write(self, filepath, data):
         """Syscall: write file"""
-        if filepath not in self.state['files']:
+        # str(bytes) would be the repr, so only stringify other types
+        if isinstance(data, (bytes, bytearray, str)):
+            size = len(data)
+        else:
+            size = len(str(data))
+        
+        entry = self.state['files'].get(filepath)
+        if entry is None:
+            now = time.time()
             self.state['files'][filepath] = {
-                'created': time.time(),
-                'modified': time.time(),
+                'created': now,
+                'modified': now,
                 'data': data,
-                'size': len(str(data))
+                'size': size
             }
             self._log(f"CREATE: {filepath}")
         else:
-            self.state['files'][filepath]['data'] = data
-            self.state['files'][filepath]['modified'] = time.time()
-            self.state['files'][filepath]['size'] = len(str(data))
+            entry['data'] = data
+            entry['modified'] = time.time()
+            entry['size'] = size
             self._log(f"WRITE: {filepath}")
         
-        return f"Written {len(str(data))} bytes to {filepath}"
+        return f"Written {size} bytes to {filepath}"
     
     def sys_exec(self, pid, name, command):
         """Syscall: execute process"""
@@ -1072,7 +1473,8 @@ class MiniKernel:
     
     def sys_mem_alloc(self, size, label="unnamed"):
         """Syscall: allocate memory"""
-        addr = f"0x{len(self.state['memory']):08x}"
+        addr = self._next_addr
+        self._next_addr += max(size, 1)
         
         self.state['memory'][addr] = {
             'size': size,
@@ -1080,17 +1482,19 @@ class MiniKernel:
             'allocated': time.time(),
             'data': bytearray(size)
         }
+        self.state['memory_total'] += size
         
-        self._log(f"MALLOC: {size} bytes at {addr} ({label})")
+        self._log(f"MALLOC: {size} bytes at 0x{addr:08x} ({label})")
         return addr
     
     def sys_mem_free(self, addr):
         """Syscall: free memory"""
         if addr not in self.state['memory']:
-            return f"ERROR: Invalid memory address {addr}"
+            return f"ERROR: Invalid memory address 0x{addr:08x}"
         
         mem = self.state['memory'].pop(addr)
-        self._log(f"FREE: {mem['size']} bytes at {addr} ({mem['label']})")
+        self.state['memory_total'] -= mem['size']
+        self._log(f"FREE: {mem['size']} bytes at 0x{addr:08x} ({mem['label']})")
         return f"Freed {mem['size']} bytes"
     
     def sys_log(self, message):
@@ -1159,12 +1563,13 @@ class MiniKernel:
     
     def syscall(self, name, *args):
         """Execute system call"""
-        if name not in self.syscalls:
+        handler = self.syscalls.get(name)
+        if handler is None:
             self._log(f"ERROR: Unknown syscall '{name}'")
             return f"ERROR: Syscall '{name}' not found"
         
         try:
-            return self.syscalls[name](*args)
+            return handler(*args)
         except Exception as e:
             self._log(f"ERROR: Syscall {name} failed: {e}")
             return f"ERROR: {e}"
@@ -1188,26 +1593,61 @@ class MiniKernel:
     def save(self, filepath=None):
         """Save kernel state"""
         if filepath is None:
-            filepath = os.path.expanduser("~/.kernel-add/kernel/state.pkl")
-        
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            filepath = os.path.expanduser(self.STATE_FILE)
+        
+        # JSON header for everything but the memory payloads and bytes file
+        # contents, which follow it as raw bytes in header order
+        memory = self.state['memory']
+        header_state = dict(self.state)
+        header_state['memory'] = [
+            dict({key: value for key, value in block.items() if key != 'data'}, addr=addr)
+            for addr, block in memory.items()
+        ]
+        header_state['processes'] = list(self.state['processes'].values())
         
-        save_data = {
-            'name': self.name,
-            'version': self.version,
-            'state': self.state,
-            'saved_at': time.time()
-        }
+        file_blobs = []
+        header_state['files'] = {}
+        for path, entry in self.state['files'].items():
+            data = entry['data']
+            if isinstance(data, (bytes, bytearray)):
+                entry = {key: value for key, value in entry.items() if key != 'data'}
+                file_blobs.append((path, data))
+            header_state['files'][path] = entry
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(save_data, f)
+        try:
+            header = json.dumps({
+                'name': self.name,
+                'version': self.version,
+                'state': header_state,
+                'memory_lengths': [len(block['data']) for block in memory.values()],
+                'file_lengths': [[path, len(data)] for path, data in file_blobs],
+                'saved_at': time.time()
+            }).encode('utf-8')
+            
+            os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+            with open(filepath, 'wb') as f:
+                f.write(self.STATE_MAGIC)
+                f.write(struct.pack('<I', len(header)))
+                f.write(header)
+                for block in memory.values():
+                    f.write(memoryview(block['data']))
+                for _, data in file_blobs:
+                    f.write(data)
+        
+        except (OSError, TypeError, ValueError) as e:
+            print(f"❌ Save failed: {e}")
+            return False
         
         print(f"💾 Kernel saved to {filepath}")
+        return True
     
     def load(self, filepath=None):
         """Load kernel state"""
         if filepath is None:
-            filepath = os.path.expanduser("~/.kernel-add/kernel/state.pkl")
+            filepath = os.path.expanduser(self.STATE_FILE)
+            legacy = os.path.expanduser(self.LEGACY_STATE_FILE)
+            if not os.path.exists(filepath) and os.path.exists(legacy):
+                filepath = legacy
         
         if not os.path.exists(filepath):
             print(f"❌ File {filepath} not found")
@@ -1215,11 +1655,38 @@ class MiniKernel:
         
         try:
             with open(filepath, 'rb') as f:
-                save_data = pickle.load(f)
+                if f.read(len(self.STATE_MAGIC)) == self.STATE_MAGIC:
+                    (header_len,) = struct.unpack('<I', f.read(4))
+                    save_data = json.loads(f.read(header_len))
+                    
+                    state = save_data['state']
+                    state['processes'] = {proc['pid']: proc for proc in state['processes']}
+                    memory = {}
+                    for block, length in zip(state['memory'], save_data['memory_lengths']):
+                        block['data'] = bytearray(length)
+                        f.readinto(block['data'])
+                        memory[block.pop('addr')] = block
+                    state['memory'] = memory
+                    for path, length in save_data.get('file_lengths', ()):
+                        state['files'][path]['data'] = f.read(length)
+                else:
+                    # State saved by older versions (pickle, hex-string addresses)
+                    import pickle
+                    f.seek(0)
+                    save_data = pickle.load(f)
+                    memory = save_data['state']['memory']
+                    save_data['state']['memory'] = {
+                        int(addr, 16) if isinstance(addr, str) else addr: block
+                        for addr, block in memory.items()
+                    }
             
             self.name = save_data['name']
             self.version = save_data['version']
             self.state = save_data['state']
+            self._next_addr = max((addr + max(block['size'], 1)
+                                   for addr, block in self.state['memory'].items()), default=0)
+            # Recomputed rather than trusted, older saves don't have it
+            self.state['memory_total'] = sum(block['size'] for block in self.state['memory'].values())
             
             saved_at = datetime.fromtimestamp(save_data['saved_at']).strftime("%Y-%m-%d %H:%M:%S")
             print(f"📂 Kernel loaded from {filepath} (saved: {saved_at})")
@@ -1235,6 +1702,19 @@ class MiniKernel:
 class ContainerEngine:
     """Virtual Container Engine - Docker-like container management"""
     
+    # Hot lookups, kept as constant SQL text so sqlite3's statement
+    # cache (keyed by SQL text) reuses the compiled statement
+    _STMTS = {
+        'create_lookup': '''SELECT (SELECT id FROM images WHERE name = ? OR id = ? LIMIT 1),
+                                   (SELECT 1 FROM containers WHERE name = ? LIMIT 1)''',
+        'find_image_tag': 'SELECT id FROM images WHERE name = ? AND tag = ?',
+        'start_lookup': 'SELECT id, name, ip_address, command FROM containers WHERE name = ? OR id = ?',
+        'stop_lookup': 'SELECT id, name FROM containers WHERE name = ? OR id = ?',
+        'remove_lookup': 'SELECT id, name, status FROM containers WHERE name = ? OR id = ?',
+        'exec_lookup': 'SELECT name, status FROM containers WHERE name = ? OR id = ?',
+        'inspect': 'SELECT * FROM containers WHERE name = ? OR id = ?',
+    }
+    
     def __init__(self, db_manager: DatabaseManager, prefix: str):
         """Initialize container engine"""
         self.db_manager = db_manager
@@ -1303,24 +1783,34 @@ class ContainerEngine:
                 )
             ''')
             
+            # containers.name (UNIQUE) and both ids (PRIMARY KEY) are already
+            # indexed; images are also looked up by name / name+tag
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_images_name_tag ON images(name, tag)')
+            # `cps` filters on status and sorts by created_time
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_containers_status '
+                           'ON containers(status, created_time)')
+            
             self.db_manager.conn.commit()
             
         except sqlite3.Error as e:
             print(f"⚠️  Container tables init error: {e}")
     
+    _ID_CHARS = tuple(string.ascii_lowercase + string.digits)
+    
+    # Constant JSON columns, serialized once
+    DEFAULT_LAYERS_JSON = json.dumps(['layer_base', 'layer_app', 'layer_config'])
+    _EMPTY_LIST_JSON = json.dumps([])
+    _EMPTY_DICT_JSON = json.dumps({})
+    
     def _generate_id(self, prefix='') -> str:
-        """Generate unique container/image ID"""
-        import random
-        import string
-        chars = string.ascii_lowercase + string.digits
-        return prefix + ''.join(random.choice(chars) for _ in range(12))
+        """Generate container/image ID (~62 bits; PRIMARY KEY catches collisions)"""
+        return prefix + ''.join(secrets.choice(self._ID_CHARS) for _ in range(12))
     
     def create_image(self, name: str, tag: str = 'latest', base_image: str = None) -> str:
         """Create container image"""
         try:
             # Check if image already exists
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('SELECT id FROM images WHERE name = ? AND tag = ?', (name, tag))
+            cursor = self.db_manager.conn.execute(self._STMTS['find_image_tag'], (name, tag))
             existing = cursor.fetchone()
             
             if existing:
@@ -1328,23 +1818,21 @@ class ContainerEngine:
                 print(f"   Image ID: {existing[0]}")
                 return existing[0]
             
-            # Generate unique ID
-            image_id = self._generate_id('img_')
-            
-            # Ensure ID is unique
-            while True:
-                cursor.execute('SELECT id FROM images WHERE id = ?', (image_id,))
-                if not cursor.fetchone():
-                    break
-                image_id = self._generate_id('img_')
-            
             # Simulate image layers
-            layers = json.dumps(['layer_base', 'layer_app', 'layer_config'])
+            layers = self.DEFAULT_LAYERS_JSON
             
-            cursor.execute('''
-                INSERT INTO images (id, name, tag, size, created_time, base_image, layers)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (image_id, name, tag, 100000000, time.time(), base_image, layers))
+            # Insert with a fresh ID; retry once on the (unlikely) ID collision
+            for attempt in range(2):
+                image_id = self._generate_id('img_')
+                try:
+                    cursor.execute('''
+                        INSERT INTO images (id, name, tag, size, created_time, base_image, layers)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', (image_id, name, tag, 100000000, time.time(), base_image, layers))
+                    break
+                except sqlite3.IntegrityError:
+                    if attempt:
+                        raise
             
             self.db_manager.conn.commit()
             
@@ -1359,19 +1847,13 @@ class ContainerEngine:
             traceback.print_exc()
             return None
     
-    def list_images(self) -> List[Dict]:
+    def list_images(self) -> List[sqlite3.Row]:
         """List all images"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('SELECT * FROM images ORDER BY created_time DESC')
-            images = []
-            for row in cursor.fetchall():
-                try:
-                    images.append(dict(row))
-                except Exception as e:
-                    print(f"⚠️  Skipping corrupted image entry: {e}")
-                    continue
-            return images
+            # sqlite3.Row already supports row['col']; no per-row dict copy
+            cursor = self.db_manager.ro_conn.execute(
+                'SELECT id, name, tag, size, created_time FROM images ORDER BY created_time DESC')
+            return cursor.fetchall()
         except sqlite3.Error as e:
             print(f"⚠️  Error listing images: {e}")
             print(f"💡 Try: dbfix")
@@ -1382,51 +1864,43 @@ class ContainerEngine:
                         env: Dict[str, str] = None) -> str:
         """Create container from image"""
         try:
-            # Find image
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('SELECT id FROM images WHERE name = ? OR id = ?', (image, image))
-            img = cursor.fetchone()
+            # Find image and check the container name in one statement
+            cursor = self.db_manager.conn.execute(self._STMTS['create_lookup'], (image, image, name))
+            image_id, existing = cursor.fetchone()
             
-            if not img:
+            if not image_id:
                 print(f"❌ Image not found: {image}")
                 print(f"💡 Create an image first with: cimage create {image}")
                 return None
             
-            image_id = img[0]
-            
-            # Check if container name already exists
-            cursor.execute('SELECT id FROM containers WHERE name = ?', (name,))
-            existing = cursor.fetchone()
-            
             if existing:
                 print(f"❌ Container name already exists: {name}")
                 print(f"   Use a different name or remove existing container with: crm {name} -f")
                 return None
             
-            # Generate unique container ID
-            container_id = self._generate_id('ctr_')
-            
-            # Ensure ID is unique
-            while True:
-                cursor.execute('SELECT id FROM containers WHERE id = ?', (container_id,))
-                if not cursor.fetchone():
-                    break
-                container_id = self._generate_id('ctr_')
-            
             # Allocate IP address
             ip_addr = f"172.17.0.{len(self.network['bridge0']['containers']) + 2}"
             
             # Serialize ports, volumes, env
-            ports_str = json.dumps(ports or [])
-            volumes_str = json.dumps(volumes or [])
-            env_str = json.dumps(env or {})
+            ports_str = _json_dumps(ports) if ports else self._EMPTY_LIST_JSON
+            volumes_str = _json_dumps(volumes) if volumes else self._EMPTY_LIST_JSON
+            env_str = _json_dumps(env) if env else self._EMPTY_DICT_JSON
             
-            cursor.execute('''
-                INSERT INTO containers 
-                (id, name, image_id, status, created_time, ip_address, ports, volumes, env_vars, command)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (container_id, name, image_id, 'created', time.time(), 
-                  ip_addr, ports_str, volumes_str, env_str, command))
+            # Insert with a fresh ID; name was checked above, so an integrity
+            # error here is an (unlikely) ID collision - retry once
+            for attempt in range(2):
+                container_id = self._generate_id('ctr_')
+                try:
+                    cursor.execute('''
+                        INSERT INTO containers 
+                        (id, name, image_id, status, created_time, ip_address, ports, volumes, env_vars, command)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (container_id, name, image_id, 'created', time.time(), 
+                          ip_addr, ports_str, volumes_str, env_str, command))
+                    break
+                except sqlite3.IntegrityError:
+                    if attempt:
+                        raise
             
             self.db_manager.conn.commit()
             
@@ -1445,30 +1919,26 @@ class ContainerEngine:
     def start_container(self, name_or_id: str) -> bool:
         """Start container"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('''
-                SELECT id, name, ip_address, command FROM containers 
-                WHERE name = ? OR id = ?
-            ''', (name_or_id, name_or_id))
-            
-            container = cursor.fetchone()
-            if not container:
-                print(f"❌ Container not found: {name_or_id}")
-                return False
-            
-            cid, cname, ip_addr, cmd = container
-            
-            # Simulate starting
-            import random
-            pid = random.randint(1000, 9999)
-            
-            cursor.execute('''
-                UPDATE containers 
-                SET status = ?, started_time = ?, pid = ?
-                WHERE id = ?
-            ''', ('running', time.time(), pid, cid))
-            
-            self.db_manager.conn.commit()
+            # Lookup and status change share one transaction / commit
+            with self.db_manager.conn:
+                cursor = self.db_manager.conn.execute(self._STMTS['start_lookup'], (name_or_id, name_or_id))
+                
+                container = cursor.fetchone()
+                if not container:
+                    print(f"❌ Container not found: {name_or_id}")
+                    return False
+                
+                cid, cname, ip_addr, cmd = container
+                
+                # Simulate starting
+                import random
+                pid = random.randint(1000, 9999)
+                
+                cursor.execute('''
+                    UPDATE containers 
+                    SET status = ?, started_time = ?, pid = ?
+                    WHERE id = ?
+                ''', ('running', time.time(), pid, cid))
             
             # Add to network
             self.network['bridge0']['containers'][cid] = {
@@ -1489,26 +1959,22 @@ class ContainerEngine:
     def stop_container(self, name_or_id: str) -> bool:
         """Stop container"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('''
-                SELECT id, name FROM containers 
-                WHERE name = ? OR id = ?
-            ''', (name_or_id, name_or_id))
-            
-            container = cursor.fetchone()
-            if not container:
-                print(f"❌ Container not found: {name_or_id}")
-                return False
-            
-            cid, cname = container
-            
-            cursor.execute('''
-                UPDATE containers 
-                SET status = ?, pid = NULL
-                WHERE id = ?
-            ''', ('stopped', cid))
-            
-            self.db_manager.conn.commit()
+            # Lookup and status change share one transaction / commit
+            with self.db_manager.conn:
+                cursor = self.db_manager.conn.execute(self._STMTS['stop_lookup'], (name_or_id, name_or_id))
+                
+                container = cursor.fetchone()
+                if not container:
+                    print(f"❌ Container not found: {name_or_id}")
+                    return False
+                
+                cid, cname = container
+                
+                cursor.execute('''
+                    UPDATE containers 
+                    SET status = ?, pid = NULL
+                    WHERE id = ?
+                ''', ('stopped', cid))
             
             # Remove from network
             if cid in self.network['bridge0']['containers']:
@@ -1524,11 +1990,7 @@ class ContainerEngine:
     def remove_container(self, name_or_id: str, force: bool = False) -> bool:
         """Remove container"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('''
-                SELECT id, name, status FROM containers 
-                WHERE name = ? OR id = ?
-            ''', (name_or_id, name_or_id))
+            cursor = self.db_manager.conn.execute(self._STMTS['remove_lookup'], (name_or_id, name_or_id))
             
             container = cursor.fetchone()
             if not container:
@@ -1551,28 +2013,21 @@ class ContainerEngine:
             print(f"❌ Failed to remove container: {e}")
             return False
     
-    def list_containers(self, all_containers: bool = False) -> List[Dict]:
+    def list_containers(self, all_containers: bool = False) -> List[sqlite3.Row]:
         """List containers"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            
+            columns = 'id, name, image_id, status, ip_address, ports, created_time'
             if all_containers:
-                cursor.execute('SELECT * FROM containers ORDER BY created_time DESC')
+                cursor = self.db_manager.ro_conn.execute(
+                    f'SELECT {columns} FROM containers ORDER BY created_time DESC')
             else:
-                cursor.execute('''
-                    SELECT * FROM containers 
-                    WHERE status = "running" 
+                cursor = self.db_manager.ro_conn.execute(f'''
+                    SELECT {columns} FROM containers 
+                    WHERE status = 'running' 
                     ORDER BY created_time DESC
                 ''')
             
-            containers = []
-            for row in cursor.fetchall():
-                try:
-                    containers.append(dict(row))
-                except Exception as e:
-                    print(f"⚠️  Skipping corrupted container entry: {e}")
-                    continue
-            return containers
+            return cursor.fetchall()
             
         except sqlite3.Error as e:
             print(f"⚠️  Error listing containers: {e}")
@@ -1582,11 +2037,7 @@ class ContainerEngine:
     def exec_container(self, name_or_id: str, command: str) -> str:
         """Execute command in container"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('''
-                SELECT name, status FROM containers 
-                WHERE name = ? OR id = ?
-            ''', (name_or_id, name_or_id))
+            cursor = self.db_manager.conn.execute(self._STMTS['exec_lookup'], (name_or_id, name_or_id))
             
             container = cursor.fetchone()
             if not container:
@@ -1607,19 +2058,13 @@ class ContainerEngine:
         except sqlite3.Error as e:
             return f"❌ Error: {e}"
     
-    def inspect_container(self, name_or_id: str) -> Optional[Dict]:
+    def inspect_container(self, name_or_id: str) -> Optional[sqlite3.Row]:
         """Inspect container details"""
         try:
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM containers 
-                WHERE name = ? OR id = ?
-            ''', (name_or_id, name_or_id))
+            cursor = self.db_manager.ro_conn.execute(self._STMTS['inspect'], (name_or_id, name_or_id))
             
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            # sqlite3.Row supports row['col'] directly; no dict copy
+            return cursor.fetchone()
             
         except sqlite3.Error as e:
             print(f"⚠️  Error inspecting container: {e}")
@@ -1640,16 +2085,24 @@ class KernelAddCLI:
     def __init__(self):
         self.pm = AddPackageManager()
         self.kernel = MiniKernel()
-        self.container = ContainerEngine(self.pm.db_manager, self.pm.prefix)
-        
-        # Initialize driver manager if available
-        if DRIVERS_AVAILABLE:
-            self.drivers = DriverManager()
-        else:
-            self.drivers = None
-        
-        # Commands
-        self.commands = {
+    
+    # Container engine, drivers and the command table are only built when
+    # first used, so one-shot commands like `install` skip them
+    
+    @functools.cached_property
+    def container(self):
+        """Container engine (creates its tables on first use)"""
+        return ContainerEngine(self.pm.db_manager, self.pm.prefix)
+    
+    @functools.cached_property
+    def drivers(self):
+        """Driver manager, or None if KernelDriver is unavailable"""
+        return DriverManager() if DRIVERS_AVAILABLE else None
+    
+    @functools.cached_property
+    def commands(self):
+        """Command name -> handler"""
+        return {
             # Package Manager Commands (add)
             'update': self._cmd_update,
             'install': self._cmd_install,
@@ -1724,6 +2177,27 @@ class KernelAddCLI:
             'help': self._cmd_help
         }
     
+    @staticmethod
+    def _json_flag(args):
+        """Strip --json from args; returns (as_json, remaining args)"""
+        if '--json' not in args:
+            return False, args
+        return True, [a for a in args if a != '--json']
+    
+    @staticmethod
+    def _print_json(obj):
+        """Emit obj as one line of JSON (for scripts; no table formatting)"""
+        sys.stdout.write(_json_dumps(obj) + '\n')
+    
+    def _resolve_path(self, path: str) -> str:
+        """Resolve a user path for the file commands (relative to the prefix)"""
+        if not path.startswith('/'):
+            path = os.path.join(self.pm.prefix, path)
+        # No-op (and no pwd lookup) unless the prefix itself starts with ~
+        if path.startswith('~'):
+            path = os.path.expanduser(path)
+        return path
+    
     # ===== PACKAGE MANAGER COMMANDS =====
     
     def _cmd_update(self, args):
@@ -1821,9 +2295,11 @@ class KernelAddCLI:
 Type 'exit' to return to main shell
         """)
         
+        get_handler = self.commands.get
         while True:
             try:
-                cmd = input("kernel> ").strip().split()
+                # split() already drops surrounding whitespace
+                cmd = input("kernel> ").split()
                 if not cmd:
                     continue
                 
@@ -1831,8 +2307,11 @@ Type 'exit' to return to main shell
                 
                 if action == 'exit':
                     break
-                elif action in self.commands:
-                    self.commands[action](cmd[1:])
+                
+                # One dict probe instead of `in` followed by []
+                handler = get_handler(action)
+                if handler:
+                    handler(cmd[1:])
                 else:
                     print(f"❌ Unknown command: {action}")
             
@@ -1869,8 +2348,10 @@ Type 'exit' to return to main shell
         print(f"{'PID':<8} {'NAME':<20} {'STATE':<12} {'COMMAND'}")
         print("-"*70)
         
-        for pid, proc in self.kernel.state['processes'].items():
-            print(f"{pid:<8} {proc['name']:<20} {proc['state']:<12} {proc['command'][:30]}")
+        # Build the table and emit it with one write instead of a print per row
+        rows = [f"{pid:<8} {proc['name']:<20} {proc['state']:<12} {proc['command'][:30]}\n"
+                for pid, proc in self.kernel.state['processes'].items()]
+        sys.stdout.write(''.join(rows))
         
         print("="*70)
     
@@ -1883,7 +2364,7 @@ Type 'exit' to return to main shell
         size = int(args[0])
         label = args[1] if len(args) > 1 else "unnamed"
         result = self.kernel.syscall('mem_alloc', size, label)
-        print(result)
+        print(f"0x{result:08x}" if isinstance(result, int) else result)
     
     def _cmd_free(self, args):
         """Free memory"""
@@ -1891,13 +2372,17 @@ Type 'exit' to return to main shell
             print("❌ Usage: free <addr>")
             return
         
-        addr = args[0]
+        try:
+            addr = int(args[0], 16)
+        except ValueError:
+            print(f"❌ Invalid memory address: {args[0]}")
+            return
         result = self.kernel.syscall('mem_free', addr)
         print(result)
     
     def _cmd_mem(self, args):
         """Show memory info"""
-        total_allocated = sum(m['size'] for m in self.kernel.state['memory'].values())
+        total_allocated = self.kernel.state['memory_total']
         
         print("\n" + "="*70)
         print(f"Memory Usage: {total_allocated:,} bytes ({total_allocated/1024:.1f} KB)")
@@ -1905,8 +2390,9 @@ Type 'exit' to return to main shell
         print(f"{'ADDRESS':<12} {'SIZE':<12} {'LABEL'}")
         print("-"*70)
         
-        for addr, mem in self.kernel.state['memory'].items():
-            print(f"{addr:<12} {mem['size']:>8} B   {mem['label']}")
+        rows = [f"0x{addr:08x}   {mem['size']:>8} B   {mem['label']}\n"
+                for addr, mem in self.kernel.state['memory'].items()]
+        sys.stdout.write(''.join(rows))
         
         print("="*70)
     
@@ -1937,8 +2423,9 @@ Type 'exit' to return to main shell
         print(f"{'FILEPATH':<40} {'SIZE':<10}")
         print("-"*70)
         
-        for filepath, file_info in self.kernel.state['files'].items():
-            print(f"{filepath:<40} {file_info['size']:>6} B")
+        rows = [f"{filepath:<40} {file_info['size']:>6} B\n"
+                for filepath, file_info in self.kernel.state['files'].items()]
+        sys.stdout.write(''.join(rows))
         
         print("="*70)
     
@@ -2035,7 +2522,6 @@ Type 'exit' to return to main shell
         self.pm.update()
         self.pm.install('python', simulate=True)
         self.pm.install('git', simulate=True)
-        time.sleep(0.5)
         
         # Test 2: Kernel operations
         print("\n2️⃣ Kernel Operations")
@@ -2044,7 +2530,6 @@ Type 'exit' to return to main shell
         self.kernel.syscall('mem_alloc', 2048, 'python_heap')
         self.kernel.syscall('write', '/etc/config.json', '{"version": "1.0"}')
         self.kernel.syscall('mount', '/dev/sda1', '/mnt/data')
-        time.sleep(0.5)
         
         # Test 3: Show status
         print("\n3️⃣ System Status")
@@ -2113,9 +2598,9 @@ Type 'exit' to return to main shell
             print("="*70)
             print(f"{'PATH':<40} {'SIZE':<15} {'MODIFIED'}")
             print("-"*70)
-            for file in files:
-                modified = time.ctime(file['modified_time'])
-                print(f"{file['path']:<40} {file['size']:>10} B    {modified}")
+            rows = [f"{file['path']:<40} {file['size']:>10} B    {_ctime(int(file['modified_time']))}\n"
+                    for file in files]
+            sys.stdout.write(''.join(rows))
             print("="*70)
             print(f"Total: {len(files)} hidden file(s)")
         else:
@@ -2142,16 +2627,15 @@ Type 'exit' to return to main shell
             print("💡 Use absolute path or relative to ~/.kernel-add/")
             return
         
-        filepath = args[0]
-        
-        # Handle relative paths
-        if not filepath.startswith('/'):
-            filepath = os.path.join(self.pm.prefix, filepath)
+        filepath = self._resolve_path(args[0])
         
-        # Expand home directory
-        filepath = os.path.expanduser(filepath)
+        # One stat() covers the exists / isfile / size / mtime checks
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            st = None
         
-        if not os.path.exists(filepath):
+        if st is None:
             print(f"❌ File not found: {filepath}")
             
             # Show suggestions
@@ -2159,22 +2643,22 @@ Type 'exit' to return to main shell
             if os.path.exists(dirname):
                 print(f"\n💡 Files in {dirname}:")
                 try:
-                    for item in os.listdir(dirname):
-                        item_path = os.path.join(dirname, item)
-                        if os.path.isfile(item_path):
-                            print(f"   - {item}")
+                    with os.scandir(dirname) as it:
+                        for entry in it:
+                            if entry.is_file():
+                                print(f"   - {entry.name}")
                 except:
                     pass
             return
         
-        if not os.path.isfile(filepath):
+        if not stat.S_ISREG(st.st_mode):
             print(f"❌ Not a file: {filepath}")
             return
         
         try:
             # Get file info
-            file_size = os.path.getsize(filepath)
-            file_mtime = time.ctime(os.path.getmtime(filepath))
+            file_size = st.st_size
+            file_mtime = time.ctime(st.st_mtime)
             
             print(f"\n📄 File: {filepath}")
             print(f"   Size: {file_size:,} bytes")
@@ -2183,15 +2667,13 @@ Type 'exit' to return to main shell
             
             # Read and display content
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                # Limit display if too large
+                # Limit display if too large - only read what is shown
                 if file_size > 10000:
-                    print(content[:5000])
+                    print(f.read(5000))
                     print(f"\n... (showing first 5000 bytes of {file_size:,} total)")
                     print(f"\n💡 File is large. Use: cat {filepath} to see full content")
                 else:
-                    print(content)
+                    print(f.read())
             
             print("="*70)
             
@@ -2200,13 +2682,7 @@ Type 'exit' to return to main shell
     
     def _cmd_fls(self, args):
         """List files in directory"""
-        path = args[0] if args else self.pm.prefix
-        
-        # Handle relative paths
-        if not path.startswith('/'):
-            path = os.path.join(self.pm.prefix, path)
-        
-        path = os.path.expanduser(path)
+        path = self._resolve_path(args[0] if args else self.pm.prefix)
         
         if not os.path.exists(path):
             print(f"❌ Path not found: {path}")
@@ -2216,45 +2692,34 @@ Type 'exit' to return to main shell
         print("="*70)
         
         try:
-            items = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                
-                if os.path.isfile(item_path):
-                    size = os.path.getsize(item_path)
-                    mtime = time.ctime(os.path.getmtime(item_path))
-                    items.append({
-                        'type': 'file',
-                        'name': item,
-                        'size': size,
-                        'mtime': mtime
-                    })
-                elif os.path.isdir(item_path):
-                    items.append({
-                        'type': 'dir',
-                        'name': item + '/',
-                        'size': 0,
-                        'mtime': ''
-                    })
+            # Directories and files are collected separately, so both sort on
+            # plain strings/tuples and the totals are just their lengths
+            dirs = []
+            files = []
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        st = entry.stat()
+                        files.append((entry.name, st.st_size, st.st_mtime))
+                    elif entry.is_dir():
+                        dirs.append(entry.name + '/')
             
             # Sort: directories first, then files
-            items.sort(key=lambda x: (x['type'] == 'file', x['name']))
+            dirs.sort()
+            files.sort()
             
-            if items:
+            if dirs or files:
                 print(f"{'NAME':<40} {'TYPE':<8} {'SIZE':<15} {'MODIFIED'}")
                 print("-"*70)
                 
-                for item in items:
-                    if item['type'] == 'dir':
-                        print(f"{item['name']:<40} {'DIR':<8} {'-':<15}")
-                    else:
-                        size_str = f"{item['size']:,} B"
-                        print(f"{item['name']:<40} {'FILE':<8} {size_str:<15} {item['mtime']}")
+                rows = [f"{name:<40} {'DIR':<8} {'-':<15}\n" for name in dirs]
+                for name, size, mtime in files:
+                    size_str = f"{size:,} B"
+                    rows.append(f"{name:<40} {'FILE':<8} {size_str:<15} {_ctime(int(mtime))}\n")
+                sys.stdout.write(''.join(rows))
                 
-                file_count = sum(1 for i in items if i['type'] == 'file')
-                dir_count = sum(1 for i in items if i['type'] == 'dir')
                 print("-"*70)
-                print(f"Total: {dir_count} directories, {file_count} files")
+                print(f"Total: {len(dirs)} directories, {len(files)} files")
             else:
                 print("(empty directory)")
             
@@ -2269,15 +2734,9 @@ Type 'exit' to return to main shell
             print("❌ Usage: fwrite <path> <content>")
             return
         
-        filepath = args[0]
+        filepath = self._resolve_path(args[0])
         content = ' '.join(args[1:])
         
-        # Handle relative paths
-        if not filepath.startswith('/'):
-            filepath = os.path.join(self.pm.prefix, filepath)
-        
-        filepath = os.path.expanduser(filepath)
-        
         # Create directory if needed
         dirname = os.path.dirname(filepath)
         if dirname and not os.path.exists(dirname):
@@ -2343,36 +2802,33 @@ Type 'exit' to return to main shell
             else:
                 print("   ✅ No duplicates found")
             
+            # Checks 2 and 3 share one statement
+            container_count, image_count = cursor.execute(
+                'SELECT (SELECT COUNT(*) FROM containers), (SELECT COUNT(*) FROM images)'
+            ).fetchone()
+            
             # Check 2: Fix container constraints
             print("\n2️⃣ Checking container constraints...")
-            cursor.execute('SELECT COUNT(*) FROM containers')
-            container_count = cursor.fetchone()[0]
             print(f"   Total containers: {container_count}")
             
             # Check 3: Fix image constraints
             print("\n3️⃣ Checking image constraints...")
-            cursor.execute('SELECT COUNT(*) FROM images')
-            image_count = cursor.fetchone()[0]
             print(f"   Total images: {image_count}")
             
             # Check 4: Orphaned dependencies
             print("\n4️⃣ Checking orphaned dependencies...")
-            cursor.execute('''
-                SELECT COUNT(*) FROM dependencies 
-                WHERE package NOT IN (SELECT name FROM packages)
-                   OR depends_on NOT IN (SELECT name FROM packages)
-            ''')
-            orphaned_deps = cursor.fetchone()[0]
-            
-            if orphaned_deps > 0:
-                print(f"   Found {orphaned_deps} orphaned dependencies")
-                print("   Cleaning...")
+            # Delete directly and count via rowcount instead of running the
+            # same NOT IN scan twice (COUNT, then DELETE)
+            with self.pm.db_manager.conn:
                 cursor.execute('''
                     DELETE FROM dependencies 
                     WHERE package NOT IN (SELECT name FROM packages)
                        OR depends_on NOT IN (SELECT name FROM packages)
                 ''')
-                self.pm.db_manager.conn.commit()
+            orphaned_deps = cursor.rowcount
+            
+            if orphaned_deps > 0:
+                print(f"   Found {orphaned_deps} orphaned dependencies")
                 print("   ✅ Cleaned")
             else:
                 print("   ✅ No orphaned dependencies")
@@ -2429,6 +2885,8 @@ Type 'exit' to return to main shell
             # Commit changes
             self.pm.db_manager.conn.commit()
             cursor.close()
+            self.pm.db_manager.load_metadata()
+            self.pm.db_manager.invalidate_caches()
 
             print("\n✅ Database cleaned successfully")
             print("💡 All data has been removed. Start fresh!")
@@ -2448,10 +2906,12 @@ Type 'exit' to return to main shell
                 print("="*80)
                 print(f"{'IMAGE ID':<15} {'NAME':<20} {'TAG':<10} {'SIZE':<15} {'CREATED'}")
                 print("-"*80)
+                rows = []
                 for img in images:
                     size_mb = img['size'] / (1024 * 1024)
-                    created = time.ctime(img['created_time'])
-                    print(f"{img['id']:<15} {img['name']:<20} {img['tag']:<10} {size_mb:>10.1f} MB  {created}")
+                    created = _ctime(int(img['created_time']))
+                    rows.append(f"{img['id']:<15} {img['name']:<20} {img['tag']:<10} {size_mb:>10.1f} MB  {created}\n")
+                sys.stdout.write(''.join(rows))
                 print("="*80)
             else:
                 print("📭 No images found")
@@ -2508,22 +2968,32 @@ Type 'exit' to return to main shell
     
     def _cmd_cps(self, args):
         """List containers"""
+        as_json, args = self._json_flag(args)
         show_all = '-a' in args or '--all' in args
         
         containers = self.container.list_containers(all_containers=show_all)
         
+        if as_json:
+            self._print_json([
+                dict(ctr, ports=_json_column(ctr['ports']) or [])
+                for ctr in containers
+            ])
+            return
+        
         if containers:
             print("\n🐳 Containers:")
             print("="*110)
             print(f"{'CONTAINER ID':<15} {'NAME':<20} {'IMAGE ID':<15} {'STATUS':<10} {'IP ADDRESS':<15} {'PORTS'}")
             print("-"*110)
             
+            rows = []
             for ctr in containers:
-                ports = json.loads(ctr.get('ports', '[]'))
+                ports = _json_column(ctr['ports'])
                 ports_str = ', '.join(ports) if ports else '-'
                 
-                print(f"{ctr['id']:<15} {ctr['name']:<20} {ctr['image_id']:<15} "
-                      f"{ctr['status']:<10} {ctr.get('ip_address', '-'):<15} {ports_str}")
+                rows.append(f"{ctr['id']:<15} {ctr['name']:<20} {ctr['image_id']:<15} "
+                            f"{ctr['status']:<10} {ctr['ip_address'] or '-':<15} {ports_str}\n")
+            sys.stdout.write(''.join(rows))
             
             print("="*110)
             print(f"Total: {len(containers)} container(s)")
@@ -2558,26 +3028,26 @@ Type 'exit' to return to main shell
             print(f"Name:        {container_info['name']}")
             print(f"Image ID:    {container_info['image_id']}")
             print(f"Status:      {container_info['status']}")
-            print(f"IP Address:  {container_info.get('ip_address', 'N/A')}")
-            print(f"PID:         {container_info.get('pid', 'N/A')}")
-            print(f"Command:     {container_info.get('command', 'N/A')}")
+            print(f"IP Address:  {container_info['ip_address'] or 'N/A'}")
+            print(f"PID:         {container_info['pid'] or 'N/A'}")
+            print(f"Command:     {container_info['command'] or 'N/A'}")
             
-            created = time.ctime(container_info['created_time'])
+            created = _ctime(int(container_info['created_time']))
             print(f"Created:     {created}")
             
-            if container_info.get('started_time'):
-                started = time.ctime(container_info['started_time'])
+            if container_info['started_time']:
+                started = _ctime(int(container_info['started_time']))
                 print(f"Started:     {started}")
             
-            ports = json.loads(container_info.get('ports', '[]'))
+            ports = _json_column(container_info['ports'])
             if ports:
                 print(f"Ports:       {', '.join(ports)}")
             
-            volumes = json.loads(container_info.get('volumes', '[]'))
+            volumes = _json_column(container_info['volumes'])
             if volumes:
                 print(f"Volumes:     {', '.join(volumes)}")
             
-            env = json.loads(container_info.get('env_vars', '{}'))
+            env = _json_column(container_info['env_vars'])
             if env:
                 print(f"Environment:")
                 for k, v in env.items():
@@ -2630,18 +3100,19 @@ Type 'exit' to return to main shell
         try:
             cursor = self.pm.db_manager.conn.cursor()
             
-            # Delete all containers
-            cursor.execute('DELETE FROM containers')
-            deleted_containers = cursor.rowcount
-            
-            # Delete all images
-            cursor.execute('DELETE FROM images')
-            deleted_images = cursor.rowcount
-            
-            # Delete all volumes
-            cursor.execute('DELETE FROM volumes')
-            
-            self.pm.db_manager.conn.commit()
+            # One transaction for all three tables: a single commit, and a
+            # rollback instead of a half-cleaned state if any DELETE fails
+            with self.pm.db_manager.conn:
+                # Delete all containers
+                cursor.execute('DELETE FROM containers')
+                deleted_containers = cursor.rowcount
+                
+                # Delete all images
+                cursor.execute('DELETE FROM images')
+                deleted_images = cursor.rowcount
+                
+                # Delete all volumes
+                cursor.execute('DELETE FROM volumes')
             
             # Reset network
             self.container.network['bridge0']['containers'] = {}
@@ -2651,7 +3122,7 @@ Type 'exit' to return to main shell
             print(f"   Deleted {deleted_images} image(s)")
             print(f"💡 You can now create fresh containers without conflicts")
             
-        except Exception as e:
+        except sqlite3.Error as e:
             print(f"❌ Error cleaning container data: {e}")
     
     # ===== DRIVER MANAGEMENT COMMANDS =====
@@ -2662,17 +3133,23 @@ Type 'exit' to return to main shell
             print("❌ Driver system not available")
             return
         
+        as_json, args = self._json_flag(args)
         drivers = self.drivers.list_drivers()
         
+        if as_json:
+            # list_drivers() returns shared read-only views
+            self._print_json([dict(drv) for drv in drivers])
+            return
+        
         print("\n🔧 Kernel Drivers:")
         print("="*90)
         print(f"{'NAME':<15} {'FULL NAME':<25} {'VERSION':<12} {'STATUS':<12} {'DEVICES'}")
         print("-"*90)
         
-        for drv in drivers:
-            status_icon = "✅" if drv['loaded'] else "⭕"
-            print(f"{drv['name']:<15} {drv['full_name']:<25} {drv['version']:<12} "
-                  f"{status_icon} {drv['status']:<10} {drv['devices']}")
+        rows = [f"{drv['name']:<15} {drv['full_name']:<25} {drv['version']:<12} "
+                f"{'✅' if drv['loaded'] else '⭕'} {drv['status']:<10} {drv['devices']}\n"
+                for drv in drivers]
+        sys.stdout.write(''.join(rows))
         
         print("="*90)
         print(f"Total: {len(drivers)} drivers ({len(self.drivers.loaded_drivers)} loaded)")
@@ -2710,6 +3187,11 @@ Type 'exit' to return to main shell
             print("❌ Driver system not available")
             return
         
+        as_json, args = self._json_flag(args)
+        if as_json:
+            self._print_json(self.drivers.get_all_devices_list())
+            return
+        
         all_devices = self.drivers.get_all_devices()
         
         if not all_devices:
@@ -2720,31 +3202,34 @@ Type 'exit' to return to main shell
         print("\n🔍 Detected Hardware Devices:")
         print("="*90)
         
+        # Collect every section and write the listing once
+        rows = []
         for driver_type, devices in all_devices.items():
-            print(f"\n{driver_type.upper()} DEVICES:")
-            print("-"*90)
+            rows.append(f"\n{driver_type.upper()} DEVICES:\n")
+            rows.append("-"*90 + "\n")
             
             if driver_type == 'block':
                 for dev in devices:
                     size_gb = dev['size'] / (1024**3)
                     mounted = "✓" if dev.get('mounted') else " "
-                    print(f"  [{mounted}] {dev['id']:<10} {dev['model']:<30} {size_gb:>8.1f} GB")
+                    rows.append(f"  [{mounted}] {dev['id']:<10} {dev['model']:<30} {size_gb:>8.1f} GB\n")
             
             elif driver_type == 'network':
                 for dev in devices:
                     state = "UP" if dev['state'] == 'up' else "DOWN"
                     ip = dev.get('ip') or 'N/A'
-                    print(f"  [{state}] {dev['id']:<10} {dev['type']:<15} MAC: {dev['mac']:<20} IP: {ip}")
+                    rows.append(f"  [{state}] {dev['id']:<10} {dev['type']:<15} MAC: {dev['mac']:<20} IP: {ip}\n")
             
             elif driver_type == 'usb':
                 for dev in devices:
-                    print(f"  {dev['id']:<12} {dev['vendor']:<15} {dev['product']:<30} {dev['type']}")
+                    rows.append(f"  {dev['id']:<12} {dev['vendor']:<15} {dev['product']:<30} {dev['type']}\n")
             
             elif driver_type == 'gpu':
                 for dev in devices:
                     vram_gb = dev['vram'] / 1024
-                    print(f"  {dev['id']:<8} {dev['vendor']} {dev['model']:<30} VRAM: {vram_gb:.0f}GB")
+                    rows.append(f"  {dev['id']:<8} {dev['vendor']} {dev['model']:<30} VRAM: {vram_gb:.0f}GB\n")
         
+        sys.stdout.write(''.join(rows))
         print("="*90)
     
     def _cmd_drvinfo(self, args):
@@ -2753,8 +3238,10 @@ Type 'exit' to return to main shell
             print("❌ Driver system not available")
             return
         
+        as_json, args = self._json_flag(args)
+        
         if not args:
-            print("❌ Usage: drvinfo <driver>")
+            print("❌ Usage: drvinfo <driver> [--json]")
             print("💡 Available: block, network, usb, gpu")
             return
         
@@ -2770,6 +3257,16 @@ Type 'exit' to return to main shell
             print(f"💡 Use: modprobe {driver_name}")
             return
         
+        if as_json:
+            self._print_json({
+                'name': driver.name,
+                'version': driver.version,
+                'status': driver.status,
+                'loaded': driver.loaded,
+                'devices': driver.devices
+            })
+            return
+        
         print(f"\n🔧 Driver Information: {driver.name}")
         print("="*70)
         print(f"Version:       {driver.version}")
@@ -2779,55 +3276,59 @@ Type 'exit' to return to main shell
         print("\nDetected Devices:")
         print("-"*70)
         
-        # Show detailed device info based on driver type
+        # Show detailed device info based on driver type, collected and
+        # written at once
+        out = []
+        w = out.append
         if driver_name == 'gpu' and driver.devices:
             for gpu_id, gpu in driver.devices.items():
-                print(f"\n{gpu_id}:")
-                print(f"  Model:          {gpu['vendor']} {gpu['model']}")
-                print(f"  VRAM:           {gpu['vram'] / 1024:.0f} GB")
-                print(f"  PCIe:           {gpu['pcie_gen']}")
-                print(f"  Driver Version: {gpu['driver_version']}")
+                w(f"\n{gpu_id}:\n")
+                w(f"  Model:          {gpu['vendor']} {gpu['model']}\n")
+                w(f"  VRAM:           {gpu['vram'] / 1024:.0f} GB\n")
+                w(f"  PCIe:           {gpu['pcie_gen']}\n")
+                w(f"  Driver Version: {gpu['driver_version']}\n")
                 
                 # Get live stats
                 stats = driver.get_stats(gpu_id)
                 if stats:
-                    print(f"  Temperature:    {stats['temperature']}°C")
-                    print(f"  Power:          {stats['power_usage']}W")
-                    print(f"  Utilization:    {stats['utilization']}%")
-                    print(f"  VRAM Used:      {stats['vram_used']} / {stats['vram_total']} MB")
+                    w(f"  Temperature:    {stats['temperature']}°C\n")
+                    w(f"  Power:          {stats['power_usage']}W\n")
+                    w(f"  Utilization:    {stats['utilization']}%\n")
+                    w(f"  VRAM Used:      {stats['vram_used']} / {stats['vram_total']} MB\n")
         
         elif driver_name == 'network' and driver.devices:
             for iface_id, iface in driver.devices.items():
                 state_icon = "🟢" if iface['state'] == 'up' else "🔴"
-                print(f"\n{state_icon} {iface_id}:")
-                print(f"  Type:      {iface['type']}")
-                print(f"  MAC:       {iface['mac']}")
-                print(f"  State:     {iface['state']}")
-                print(f"  IP:        {iface.get('ip', 'Not assigned')}")
-                print(f"  Speed:     {iface['speed']}")
-                print(f"  Driver:    {iface['driver']}")
+                w(f"\n{state_icon} {iface_id}:\n")
+                w(f"  Type:      {iface['type']}\n")
+                w(f"  MAC:       {iface['mac']}\n")
+                w(f"  State:     {iface['state']}\n")
+                w(f"  IP:        {iface.get('ip', 'Not assigned')}\n")
+                w(f"  Speed:     {iface['speed']}\n")
+                w(f"  Driver:    {iface['driver']}\n")
         
         elif driver_name == 'block' and driver.devices:
             for dev_id, dev in driver.devices.items():
                 size_gb = dev['size'] / (1024**3)
-                print(f"\n{dev_id}:")
-                print(f"  Type:       {dev['type']}")
-                print(f"  Model:      {dev['model']}")
-                print(f"  Size:       {size_gb:.1f} GB ({dev['size']:,} bytes)")
-                print(f"  Mounted:    {'Yes' if dev.get('mounted') else 'No'}")
+                w(f"\n{dev_id}:\n")
+                w(f"  Type:       {dev['type']}\n")
+                w(f"  Model:      {dev['model']}\n")
+                w(f"  Size:       {size_gb:.1f} GB ({dev['size']:,} bytes)\n")
+                w(f"  Mounted:    {'Yes' if dev.get('mounted') else 'No'}\n")
                 if dev.get('mounted'):
-                    print(f"  Mountpoint: {dev.get('mountpoint')}")
+                    w(f"  Mountpoint: {dev.get('mountpoint')}\n")
                 if dev.get('partitions'):
-                    print(f"  Partitions: {', '.join(dev['partitions'])}")
+                    w(f"  Partitions: {', '.join(dev['partitions'])}\n")
         
         elif driver_name == 'usb' and driver.devices:
             for usb_id, usb in driver.devices.items():
-                print(f"\n{usb_id} (Port {usb['port']}):")
-                print(f"  Vendor:     {usb['vendor']} ({usb['vendor_id']})")
-                print(f"  Product:    {usb['product']} ({usb['product_id']})")
-                print(f"  Type:       {usb['type']}")
-                print(f"  Speed:      {usb['speed']}")
+                w(f"\n{usb_id} (Port {usb['port']}):\n")
+                w(f"  Vendor:     {usb['vendor']} ({usb['vendor_id']})\n")
+                w(f"  Product:    {usb['product']} ({usb['product_id']})\n")
+                w(f"  Type:       {usb['type']}\n")
+                w(f"  Speed:      {usb['speed']}\n")
         
+        sys.stdout.write(''.join(out))
         print("="*70)
     
     def _cmd_help(self, args):
@@ -2897,18 +3398,18 @@ Type 'exit' to return to main shell
   cstart <ctr>        Start container
   cstop <ctr>         Stop container
   crm <ctr> [-f]      Remove container (force)
-  cps [-a]            List containers (all)
+  cps [-a] [--json]   List containers (all)
   cexec <ctr> <cmd>   Execute command in container
   cinspect <ctr>      Inspect container details
   cnetwork [name]     Inspect container network
   cclean              Clean all container data (RESET)
 
 🔧 DRIVER MANAGEMENT:
-  lsmod               List loaded drivers
+  lsmod [--json]      List loaded drivers
   modprobe <driver>   Load driver module
   rmmod <driver>      Unload driver module
-  lsdev               List all hardware devices
-  drvinfo <driver>    Show driver/device details
+  lsdev [--json]      List all hardware devices
+  drvinfo <driver>    Show driver/device details (--json)
 
 💡 MIRRORS:
   1. https://mirror.nevacloud.com/applications/termux/termux-main
@@ -2927,8 +3428,9 @@ Type 'exit' to return to main shell
         command = sys.argv[1]
         args = sys.argv[2:]
         
-        if command in self.commands:
-            self.commands[command](args)
+        handler = self.commands.get(command)
+        if handler:
+            handler(args)
         else:
             print(f"❌ Unknown command: {command}")
             self._cmd_help([])
@@ -2945,9 +3447,10 @@ Type 'help' for commands, 'exit' to quit
 Active mirror: {}
         """.format(self.pm.current_mirror))
         
+        get_handler = self.commands.get
         while True:
             try:
-                cmd = input("[localhost[@]MiniKernel]>-~& ").strip().split()
+                cmd = input("[localhost[@]MiniKernel]>-~& ").split()
                 if not cmd:
                     continue
                 
@@ -2960,9 +3463,9 @@ Active mirror: {}
                     print("👋 Goodbye!")
                     break
                 
-                elif action in self.commands:
-                    self.commands[action](cmd[1:])
-                
+                handler = get_handler(action)
+                if handler:
+                    handler(cmd[1:])
                 else:
                     print(f"❌ Unknown command: {action}")
                     print("Type 'help' for available commands")
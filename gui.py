@@ -6,84 +6,320 @@ GUI sederhana - step by step improvement
 
 import sys
 import os
+import importlib.util
+from collections import deque
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTextEdit, QLabel, QLineEdit, QTabWidget,
-    QGroupBox, QMessageBox, QInputDialog
+    QPushButton, QListView, QLabel, QLineEdit, QTabWidget,
+    QGroupBox, QMessageBox, QInputDialog, QSizePolicy
+)
+from PyQt6.QtCore import (
+    Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot, QAbstractListModel, QModelIndex
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QColor, QPalette
 
-# Import kernel components
-try:
-    from LinuxKernel import KernelAddCLI
-    KERNEL_AVAILABLE = True
-except ImportError:
-    KERNEL_AVAILABLE = False
+# Kernel components are imported on the worker thread (see CommandWorker.init_cli);
+# here we only check that the module exists so the window can paint right away
+KERNEL_AVAILABLE = importlib.util.find_spec("LinuxKernel") is not None
+if not KERNEL_AVAILABLE:
     print("⚠️  LinuxKernel.py not found")
 
 
-class CommandThread(QThread):
-    """Thread untuk execute commands tanpa freeze GUI"""
-    output_ready = pyqtSignal(str)
+# Application-wide stylesheet, applied once in main(); widgets are matched
+# by objectName, the "category" property or the "class" property
+APP_QSS = """
+    QLabel#titleLabel {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 #2c3e50, stop:1 #34495e);
+        color: white;
+        padding: 15px;
+        border-bottom: 3px solid #3498db;
+    }
+    QLabel#outputLabel {
+        color: #2c3e50;
+        padding: 5px;
+    }
+    QLabel#cmdLabel {
+        color: #2c3e50;
+    }
+    
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #3498db;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QGroupBox[category="kernel"] { border-color: #e74c3c; }
+    QGroupBox[category="driver"] { border-color: #f39c12; }
+    QGroupBox[category="container"] { border-color: #9b59b6; }
+    
+    QPushButton.cmdBtn {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 5px;
+        font-weight: bold;
+    }
+    QPushButton.cmdBtn:hover {
+        background-color: #2980b9;
+    }
+    QPushButton.cmdBtn:pressed {
+        background-color: #21618c;
+    }
+    
+    QPushButton#clearBtn {
+        background-color: #e74c3c;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton#clearBtn:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#clearBtn:pressed {
+        background-color: #a93226;
+    }
     
-    def __init__(self, cli, command):
+    QPushButton#execBtn {
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 5px 15px;
+        font-weight: bold;
+    }
+    QPushButton#execBtn:hover {
+        background-color: #229954;
+    }
+    QPushButton#execBtn:pressed {
+        background-color: #1e8449;
+    }
+    
+    QListView#outputView {
+        background-color: #0d1117;
+        color: #58d68d;
+        border: 2px solid #34495e;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    
+    QLineEdit#commandInput {
+        border: 2px solid #3498db;
+        border-radius: 5px;
+        padding: 5px 10px;
+        background-color: white;
+    }
+    QLineEdit#commandInput:focus {
+        border: 2px solid #2980b9;
+    }
+    
+    QStatusBar {
+        background-color: #34495e;
+        color: white;
+        font-size: 11pt;
+        font-weight: bold;
+        padding: 5px;
+    }
+"""
+
+
+@lru_cache(maxsize=16)
+def _font(family, size, bold=False, fixed=False):
+    """Shared QFont per (family, size, bold, fixed); built on first use, after QApplication exists"""
+    if bold:
+        font = QFont(family, size, QFont.Weight.Bold)
+    else:
+        font = QFont(family, size)
+    if fixed:
+        # Fall back to the system monospace font when the family is missing
+        font.setStyleHint(QFont.StyleHint.TypeWriter)
+        font.setFixedPitch(True)
+    return font
+
+
+class CommandWorker(QObject):
+    """Runs commands one at a time on a long-lived thread so the GUI never freezes"""
+    # Non-empty output lines, split here in the worker rather than on the GUI thread
+    output_ready = pyqtSignal(list)
+    # (action, args, tracked) of the command that just finished; tracked is
+    # passed through from command_requested
+    command_finished = pyqtSignal(str, list, bool)
+    # True once the kernel CLI is loaded, False if loading failed
+    cli_ready = pyqtSignal(bool)
+    
+    def __init__(self):
         super().__init__()
-        self.cli = cli
-        self.command = command
+        self.cli = None
     
-    def run(self):
+    @pyqtSlot()
+    def init_cli(self):
+        """Import and create the kernel CLI on the worker thread"""
+        try:
+            from LinuxKernel import KernelAddCLI
+            self.cli = KernelAddCLI()
+        except Exception as e:
+            self.output_ready.emit([f"❌ Failed to load kernel: {e}"])
+            self.cli_ready.emit(False)
+            return
+        self.cli_ready.emit(True)
+    
+    @staticmethod
+    def parse(command):
+        """Split a typed command line into (action, args)"""
+        action, *args = command.split() or ['']
+        return action.lower(), args
+    
+    @pyqtSlot(str, list, bool)
+    def execute(self, action, args, tracked=False):
         """Execute command dan emit output"""
         import io
         
-        # Parse command
-        parts = self.command.split()
-        if not parts:
+        if not action:
+            self.command_finished.emit(action, args, tracked)
             return
         
-        action = parts[0].lower()
-        args = parts[1:]
+        if self.cli is None:
+            self.output_ready.emit(["❌ Kernel not available"])
+            self.command_finished.emit(action, args, tracked)
+            return
         
         # Capture output
         old_stdout = sys.stdout
         sys.stdout = io.StringIO()
         
         try:
-            if action in self.cli.commands:
-                self.cli.commands[action](args)
+            handler = self.cli.commands.get(action)
+            if handler is not None:
+                handler(args)
             else:
                 print(f"❌ Unknown command: {action}")
                 print("Type 'help' for available commands")
             
             # Get output
-            output = sys.stdout.getvalue()
-            if output:
-                self.output_ready.emit(output)
+            lines = [line for line in sys.stdout.getvalue().splitlines() if line]
+            if lines:
+                self.output_ready.emit(lines)
         
         except Exception as e:
-            self.output_ready.emit(f"❌ Error: {e}")
+            self.output_ready.emit([f"❌ Error: {e}"])
         
         finally:
             sys.stdout = old_stdout
+            self.command_finished.emit(action, args, tracked)
+
+
+class LogModel(QAbstractListModel):
+    """Lines of the output console (bounded; the view lays out visible rows only)"""
+    
+    def __init__(self, max_lines, parent=None):
+        super().__init__(parent)
+        self._lines = deque(maxlen=max_lines)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._lines[index.row()]
+        return None
+    
+    def append_many(self, lines):
+        """Append a batch of lines with one insert notification"""
+        max_lines = self._lines.maxlen
+        lines = list(lines)[-max_lines:]
+        if not lines:
+            return
+        
+        # Drop the oldest rows first so row numbers stay valid for the view
+        overflow = len(self._lines) + len(lines) - max_lines
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._lines.popleft()
+            self.endRemoveRows()
+        
+        start = len(self._lines)
+        self.beginInsertRows(QModelIndex(), start, start + len(lines) - 1)
+        self._lines.extend(lines)
+        self.endInsertRows()
+    
+    def clear(self):
+        """Remove all lines"""
+        self.beginResetModel()
+        self._lines.clear()
+        self.endResetModel()
 
 
 class KernelGUI(QMainWindow):
     """Main GUI Window - Simple Version"""
     
+    # Scrollback limit; older lines are dropped so appends stay cheap
+    CONSOLE_MAX_LINES = 5000
+    
+    # (action, args, tracked) for the worker; queued across threads.
+    # tracked marks button commands registered in _inflight
+    command_requested = pyqtSignal(str, list, bool)
+    
+    # Sidebar groups: (title, stylesheet category, ((button text, handler name), ...))
+    GROUPS = (
+        ("📦 Package Manager", "pkg", (
+            ("Update Packages", "cmd_update"),
+            ("List Installed", "cmd_list"),
+            ("Search Packages", "cmd_search"),
+        )),
+        ("🐧 Kernel", "kernel", (
+            ("Kernel Status", "cmd_kstatus"),
+            ("List Processes", "cmd_ps"),
+            ("Memory Info", "cmd_mem"),
+        )),
+        ("🔧 Drivers", "driver", (
+            ("List Drivers", "cmd_lsmod"),
+            ("List Devices", "cmd_lsdev"),
+        )),
+        ("🐳 Containers", "container", (
+            ("List Containers", "cmd_cps"),
+            ("List Images", "cmd_cimage"),
+        )),
+    )
+    
     def __init__(self):
         super().__init__()
         
-        # Initialize kernel CLI
-        if KERNEL_AVAILABLE:
-            self.cli = KernelAddCLI()
-        else:
-            self.cli = None
+        # Button commands still queued or running: (action, *args) -> button
+        self._inflight = {}
         
         self.init_ui()
+        
+        # One worker thread for the whole session; it loads the kernel CLI
+        # first, and commands clicked meanwhile simply queue up behind it
+        self.worker_thread = None
+        if KERNEL_AVAILABLE:
+            self.worker_thread = QThread(self)
+            self.worker = CommandWorker()
+            self.worker.moveToThread(self.worker_thread)
+            self.worker_thread.started.connect(self.worker.init_cli)
+            self.command_requested.connect(self.worker.execute)
+            self.worker.output_ready.connect(self.handle_output)
+            self.worker.command_finished.connect(self.handle_finished)
+            self.worker.cli_ready.connect(self.handle_cli_ready)
+            self.worker_thread.start()
     
     def init_ui(self):
         """Initialize UI - SIMPLE LAYOUT"""
         
+        # No repaints while the widgets are being built
+        self.setUpdatesEnabled(False)
+        
         # Window setup
         self.setWindowTitle("Kernel-Add GUI v1.0")
         self.setGeometry(100, 100, 1000, 700)  # Larger window
@@ -100,16 +336,9 @@ class KernelGUI(QMainWindow):
         
         # ===== TITLE =====
         title_label = QLabel("🐧 KERNEL-ADD CONTROL PANEL")
-        title_font = QFont("Arial", 18, QFont.Weight.Bold)
-        title_label.setFont(title_font)
+        title_label.setFont(_font("Arial", 18, bold=True))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                       stop:0 #2c3e50, stop:1 #34495e);
-            color: white;
-            padding: 15px;
-            border-bottom: 3px solid #3498db;
-        """)
+        title_label.setObjectName("titleLabel")
         main_layout.addWidget(title_label)
         
         # ===== CONTENT LAYOUT =====
@@ -120,133 +349,27 @@ class KernelGUI(QMainWindow):
         
         # ===== LEFT PANEL - Buttons =====
         left_panel = QWidget()
-        left_panel.setMaximumWidth(240)  # Slightly wider
+        left_panel.setFixedWidth(240)  # Fixed, so resizes only re-layout the console
         left_layout = QVBoxLayout()
         left_layout.setSpacing(10)  # Space between groups
         left_panel.setLayout(left_layout)
         
-        # Package Manager Group
-        pkg_group = QGroupBox("📦 Package Manager")
-        pkg_group.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        pkg_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #3498db;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        pkg_layout = QVBoxLayout()
-        
-        self.create_button(pkg_layout, "Update Packages", self.cmd_update)
-        self.create_button(pkg_layout, "List Installed", self.cmd_list)
-        self.create_button(pkg_layout, "Search Packages", self.cmd_search)
-        
-        pkg_group.setLayout(pkg_layout)
-        left_layout.addWidget(pkg_group)
-        
-        # Kernel Group
-        kernel_group = QGroupBox("🐧 Kernel")
-        kernel_group.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        kernel_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e74c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        kernel_layout = QVBoxLayout()
-        
-        self.create_button(kernel_layout, "Kernel Status", self.cmd_kstatus)
-        self.create_button(kernel_layout, "List Processes", self.cmd_ps)
-        self.create_button(kernel_layout, "Memory Info", self.cmd_mem)
-        
-        kernel_group.setLayout(kernel_layout)
-        left_layout.addWidget(kernel_group)
-        
-        # Drivers Group
-        driver_group = QGroupBox("🔧 Drivers")
-        driver_group.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        driver_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #f39c12;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        driver_layout = QVBoxLayout()
-        
-        self.create_button(driver_layout, "List Drivers", self.cmd_lsmod)
-        self.create_button(driver_layout, "List Devices", self.cmd_lsdev)
-        
-        driver_group.setLayout(driver_layout)
-        left_layout.addWidget(driver_group)
-        
-        # Containers Group
-        container_group = QGroupBox("🐳 Containers")
-        container_group.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        container_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #9b59b6;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        container_layout = QVBoxLayout()
-        
-        self.create_button(container_layout, "List Containers", self.cmd_cps)
-        self.create_button(container_layout, "List Images", self.cmd_cimage)
-        
-        container_group.setLayout(container_layout)
-        left_layout.addWidget(container_group)
+        # Command groups (Package Manager, Kernel, Drivers, Containers), one tab
+        # each; a tab's buttons are only built the first time it is opened
+        self.group_tabs = QTabWidget()
+        self.built_tabs = set()
+        for title, _, _ in self.GROUPS:
+            index = self.group_tabs.addTab(QWidget(), title.split()[0])
+            self.group_tabs.setTabToolTip(index, title)
+        self.group_tabs.currentChanged.connect(self._build_tab_contents)
+        self._build_tab_contents(self.group_tabs.currentIndex())
+        left_layout.addWidget(self.group_tabs)
         
         # System buttons
         clear_btn = QPushButton("🗑️  Clear Output")
-        clear_btn.setMinimumHeight(40)
-        clear_btn.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        clear_btn.setFixedHeight(40)
+        clear_btn.setFont(_font("Arial", 11, bold=True))
+        clear_btn.setObjectName("clearBtn")
         clear_btn.clicked.connect(self.clear_output)
         left_layout.addWidget(clear_btn)
         
@@ -261,73 +384,50 @@ class KernelGUI(QMainWindow):
         
         # Output label
         output_label = QLabel("📺 Output Console:")
-        output_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        output_label.setStyleSheet("color: #2c3e50; padding: 5px;")
+        output_label.setFont(_font("Arial", 12, bold=True))
+        output_label.setObjectName("outputLabel")
         right_layout.addWidget(output_label)
         
-        # Output console
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setFont(QFont("Consolas", 11))  # Larger font
-        
-        # Terminal style with better contrast
-        self.output_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0d1117;
-                color: #58d68d;
-                border: 2px solid #34495e;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
-        
-        right_layout.addWidget(self.output_text)
+        # Output console: a list view over LogModel, so only the visible
+        # lines are laid out however long the scrollback gets
+        self.output_model = LogModel(self.CONSOLE_MAX_LINES, self)
+        self.output_view = QListView()
+        self.output_view.setModel(self.output_model)
+        self.output_view.setUniformItemSizes(True)
+        self.output_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.output_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.output_view.setWordWrap(False)  # Terminal log: one row per line
+        self.output_view.setFont(_font("Consolas", 11, fixed=True))  # Larger font
+        self.output_view.setObjectName("outputView")  # Terminal style
+        
+        # Scroll to the newest line at most once per 50 ms, not once per append
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(50)
+        self.scroll_timer.timeout.connect(self.output_view.scrollToBottom)
+        
+        right_layout.addWidget(self.output_view)
         
         # Command input
         cmd_layout = QHBoxLayout()
         
         cmd_label = QLabel("⌨️  Command:")
-        cmd_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        cmd_label.setStyleSheet("color: #2c3e50;")
+        cmd_label.setFont(_font("Arial", 11, bold=True))
+        cmd_label.setObjectName("cmdLabel")
         cmd_layout.addWidget(cmd_label)
         
         self.command_input = QLineEdit()
-        self.command_input.setFont(QFont("Consolas", 11))
+        self.command_input.setFont(_font("Consolas", 11, fixed=True))
         self.command_input.setPlaceholderText("Type command here...")
         self.command_input.setMinimumHeight(35)
-        self.command_input.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #3498db;
-                border-radius: 5px;
-                padding: 5px 10px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #2980b9;
-            }
-        """)
+        self.command_input.setObjectName("commandInput")
         self.command_input.returnPressed.connect(self.execute_command)
         cmd_layout.addWidget(self.command_input)
         
         exec_btn = QPushButton("▶️  Execute")
         exec_btn.setMinimumHeight(35)
-        exec_btn.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        exec_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 5px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
+        exec_btn.setFont(_font("Arial", 11, bold=True))
+        exec_btn.setObjectName("execBtn")
         exec_btn.clicked.connect(self.execute_command)
         cmd_layout.addWidget(exec_btn)
         
@@ -336,67 +436,78 @@ class KernelGUI(QMainWindow):
         content_layout.addWidget(right_panel)
         
         # ===== STATUS BAR =====
-        self.statusBar().setStyleSheet("""
-            QStatusBar {
-                background-color: #34495e;
-                color: white;
-                font-size: 11pt;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
         if KERNEL_AVAILABLE:
-            self.statusBar().showMessage("✅ Kernel loaded successfully - Ready to execute commands")
+            self.statusBar().showMessage("⏳ Loading kernel...")
         else:
             self.statusBar().showMessage("❌ Kernel not available - Running in demo mode")
         
         # ===== WELCOME MESSAGE =====
-        self.print_output("=" * 70)
-        self.print_output("  KERNEL-ADD GUI v1.0 (PyQt6)")
-        self.print_output("  Simple Interface for Kernel Management")
-        self.print_output("=" * 70)
-        self.print_output("")
+        welcome = [
+            "=" * 70,
+            "  KERNEL-ADD GUI v1.0 (PyQt6)",
+            "  Simple Interface for Kernel Management",
+            "=" * 70,
+            "",
+        ]
         if KERNEL_AVAILABLE:
-            self.print_output("✅ Kernel loaded successfully")
-            self.print_output("💡 Click 'Update Packages' to fetch real packages from Alpine")
-            self.print_output("💡 Or use buttons for quick commands")
+            welcome += [
+                "⏳ Loading kernel in background...",
+                "💡 Click 'Update Packages' to fetch real packages from Alpine",
+                "💡 Or use buttons for quick commands",
+            ]
         else:
-            self.print_output("❌ Kernel not available - GUI demo mode")
-        self.print_output("")
+            welcome.append("❌ Kernel not available - GUI demo mode")
+        welcome.append("")
+        self.print_lines(welcome)
+        
+        self.setUpdatesEnabled(True)
+    
+    def _build_tab_contents(self, index):
+        """Isi tab grup saat pertama kali dibuka"""
+        if index < 0 or index in self.built_tabs:
+            return
+        self.built_tabs.add(index)
+        
+        title, category, buttons = self.GROUPS[index]
+        page_layout = QVBoxLayout(self.group_tabs.widget(index))
+        page_layout.addWidget(self._build_group(title, category, buttons))
+        page_layout.addStretch()
+    
+    def _build_group(self, title, category, buttons):
+        """Build one sidebar QGroupBox with its command buttons"""
+        group = QGroupBox(title)
+        group.setFont(_font("Arial", 11, bold=True))
+        group.setProperty("category", category)
+        layout = QVBoxLayout()
+        for text, handler in buttons:
+            self.create_button(layout, text, getattr(self, handler))
+        group.setLayout(layout)
+        return group
     
     def create_button(self, layout, text, callback):
         """Helper untuk create button dengan style bagus"""
         btn = QPushButton(text)
         btn.clicked.connect(callback)
-        btn.setMinimumHeight(35)  # Tinggi button
-        btn.setFont(QFont("Arial", 10))  # Font size
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        btn.setFixedHeight(35)  # Tinggi button
+        btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        btn.setFont(_font("Arial", 10))  # Font size
+        btn.setProperty("class", "cmdBtn")
         layout.addWidget(btn)
         return btn
     
     def print_output(self, text):
         """Print to output console"""
-        self.output_text.append(text)
-        self.output_text.ensureCursorVisible()
+        self.print_lines((text,))
+    
+    def print_lines(self, lines):
+        """Print several lines to output console in one batch"""
+        self.output_model.append_many(lines)
+        if not self.scroll_timer.isActive():
+            self.scroll_timer.start()
     
     def clear_output(self):
         """Clear output console"""
-        self.output_text.clear()
+        self.output_model.clear()
         self.print_output("Output cleared.")
     
     def execute_command(self):
@@ -413,20 +524,51 @@ class KernelGUI(QMainWindow):
         self.print_output(f"[localhost[@]MiniKernel]>-~& {command}")
         
         # Run command in thread
-        self.run_command_thread(command)
+        action, args = CommandWorker.parse(command)
+        self.command_requested.emit(action, args, False)
     
-    def run_command_thread(self, command):
-        """Run command in background thread"""
-        self.thread = CommandThread(self.cli, command)
-        self.thread.output_ready.connect(self.handle_output)
-        self.thread.finished.connect(lambda: self.print_output(""))
-        self.thread.start()
+    def run_command_thread(self, action, *args):
+        """Run an already-split command on the worker thread (once at a time per command)"""
+        key = (action, *args)
+        if key in self._inflight:
+            return  # Same command still pending; drop the repeated click
+        
+        # Disable the clicked button until its command has finished
+        btn = self.sender()
+        if isinstance(btn, QPushButton):
+            btn.setEnabled(False)
+        self._inflight[key] = btn
+        
+        self.command_requested.emit(action, list(args), True)
+    
+    def handle_output(self, lines):
+        """Handle command output (list of non-empty lines)"""
+        self.print_lines(lines)
+    
+    def handle_cli_ready(self, ok):
+        """Kernel CLI finished loading on the worker thread"""
+        if ok:
+            self.print_output("✅ Kernel loaded successfully")
+            self.statusBar().showMessage("✅ Kernel loaded successfully - Ready to execute commands")
+        else:
+            self.statusBar().showMessage("❌ Kernel failed to load")
+    
+    def handle_finished(self, action, args, tracked):
+        """Blank line after each command's output"""
+        # Typed commands are not deduplicated, so they must not release
+        # a pending button command with the same action
+        if tracked:
+            btn = self._inflight.pop((action, *args), None)
+            if isinstance(btn, QPushButton):
+                btn.setEnabled(True)
+        self.print_output("")
     
-    def handle_output(self, output):
-        """Handle command output"""
-        for line in output.split('\n'):
-            if line:
-                self.print_output(line)
+    def closeEvent(self, event):
+        """Stop the worker thread with the window"""
+        if self.worker_thread:
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        super().closeEvent(event)
     
     # ===== COMMAND HANDLERS =====
     
@@ -452,7 +594,7 @@ class KernelGUI(QMainWindow):
         query, ok = QInputDialog.getText(self, "Search Packages", "Enter search query:")
         if ok and query:
             self.print_output(f"[Executing: search {query}]")
-            self.run_command_thread(f"search {query}")
+            self.run_command_thread("search", *query.split())
     
     def cmd_kstatus(self):
         """Kernel status"""
@@ -494,14 +636,14 @@ class KernelGUI(QMainWindow):
         if not KERNEL_AVAILABLE:
             return
         self.print_output("[Executing: cps -a]")
-        self.run_command_thread("cps -a")
+        self.run_command_thread("cps", "-a")
     
     def cmd_cimage(self):
         """List images"""
         if not KERNEL_AVAILABLE:
             return
         self.print_output("[Executing: cimage ls]")
-        self.run_command_thread("cimage ls")
+        self.run_command_thread("cimage", "ls")
 
 
 # ===== MAIN =====
@@ -513,6 +655,7 @@ def main():
     
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(APP_QSS)
     
     # Create and show GUI
     gui = KernelGUI()
@@ -0,0 +1,24 @@
+"""Save/load round trip for MiniKernel state"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from LinuxKernel import MiniKernel
+
+
+def test_save_and_load_bytes_file(tmp_path):
+    kernel = MiniKernel()
+    kernel.sys_write("/etc/motd", "hello")
+    kernel.sys_write("/bin/blob", b"\x00\x01binary\xff")
+    kernel.sys_mem_alloc(16)
+    
+    path = str(tmp_path / "state.bin")
+    assert kernel.save(path)
+    
+    restored = MiniKernel()
+    assert restored.load(path)
+    assert restored.state['files']["/bin/blob"]['data'] == b"\x00\x01binary\xff"
+    assert restored.state['files']["/etc/motd"]['data'] == "hello"
+    assert restored.state['memory_total'] == kernel.state['memory_total']